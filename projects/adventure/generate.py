@@ -0,0 +1,143 @@
+"""
+Generate a random maze map of any size, for trying the traversal code on
+maps much larger than the ones in maps/.
+
+The maze fills a width x height grid one row at a time with Eller's
+algorithm. Only the current row is kept in memory and each room is
+written as soon as its row is done, so even maps with millions of rooms
+are streamed straight to disk. The same seed and settings always give
+the same maze.
+
+Run from the repository root with:
+    python3 -m projects.adventure.generate output_file --rooms N [--seed S] [--loops P]
+        [--branching P] [--corridors P] [--width W]
+
+Output ending in .map is written in the binary format of mapfile.py,
+anything else in the text format of maps/main_maze.txt.
+"""
+import argparse
+import math
+import os
+import random
+import time
+
+from .mapfile import MAP_EXTENSION, write_rooms, write_text_map
+from ..util import DisjointSet
+
+
+def generate_rooms(num_rooms, seed=None, loops=0.0, branching=0.3, corridors=0.5, width=None):
+    """
+    Generate (room_id, (x, y), exits) for every room of a random maze, in
+    room ID order. Room 0 is at (0, 0) and room IDs run along each row.
+
+    The grid is width rooms wide (about square by default), with the last
+    row cut short to give exactly num_rooms rooms. Without loops every
+    room is reachable from every other in exactly one way. The
+    probabilities:
+
+    * corridors: joining two rooms side by side that are not yet
+      connected. Higher values give long east-west corridors.
+    * branching: a room opening north when another room of its group
+      already does. Higher values give more side branches.
+    * loops: joining two rooms side by side that are already connected,
+      which creates a cycle.
+    """
+    if num_rooms <= 0:
+        return
+    if width is None:
+        width = math.isqrt(num_rooms - 1) + 1
+    height = -(-num_rooms // width)
+    last_width = num_rooms - (height - 1) * width
+    rng = random.Random(seed)
+
+    # Group label of each column in the current row; rooms with the same
+    # label are already connected through earlier rows
+    labels = list(range(width))
+    south = [False] * width
+
+    for y in range(height):
+        last = y == height - 1
+        # How many rooms of this row have a room to their north
+        reach = last_width if y == height - 2 else width
+
+        # Union-find over this row's columns, starting from the groups
+        # carried up from the row below
+        groups = DisjointSet(width)
+        first_column = {}
+        for x, label in enumerate(labels):
+            if label in first_column:
+                groups.union(first_column[label], x)
+            else:
+                first_column[label] = x
+
+        row_width = last_width if last else width
+        east = [False] * width
+        for x in range(row_width - 1):
+            if groups.find(x) != groups.find(x + 1):
+                # The last row joins every group left, so the maze is whole.
+                # Below a short last row, rooms past its end join up so
+                # their group reaches a room that has a room to its north.
+                if last or x + 1 >= reach or rng.random() < corridors:
+                    groups.union(x, x + 1)
+                    east[x] = True
+            elif rng.random() < loops:
+                east[x] = True
+
+        # Every group continues north through at least one of its rooms
+        north = [False] * width
+        if not last:
+            members = {}
+            for x in range(reach):
+                members.setdefault(groups.find(x), []).append(x)
+            for columns in members.values():
+                north[rng.choice(columns)] = True
+                for x in columns:
+                    if not north[x] and rng.random() < branching:
+                        north[x] = True
+
+        base = y * width
+        for x in range(row_width):
+            room_id = base + x
+            exits = {}
+            if north[x]:
+                exits['n'] = room_id + width
+            if south[x]:
+                exits['s'] = room_id - width
+            if east[x]:
+                exits['e'] = room_id + 1
+            if x > 0 and east[x - 1]:
+                exits['w'] = room_id - 1
+            yield room_id, (x, y), exits
+
+        # Rooms opening north keep their group (a column index below
+        # width); the rest of the next row starts in groups of their own
+        labels = [groups.find(x) if north[x] else width + x for x in range(width)]
+        south = north
+
+
+def write_maze(path, num_rooms, seed=None, loops=0.0, branching=0.3, corridors=0.5, width=None):
+    """
+    Stream a maze from generate_rooms to path, in the binary format for
+    .map files and the text format otherwise. Returns the room count.
+    """
+    rooms = generate_rooms(num_rooms, seed, loops, branching, corridors, width)
+    if os.path.splitext(path)[1] == MAP_EXTENSION:
+        return write_rooms(path, rooms)
+    return write_text_map(path, rooms)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("output_file")
+    parser.add_argument("--rooms", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--loops", type=float, default=0.0)
+    parser.add_argument("--branching", type=float, default=0.3)
+    parser.add_argument("--corridors", type=float, default=0.5)
+    parser.add_argument("--width", type=int, default=None)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    count = write_maze(args.output_file, args.rooms, args.seed, args.loops, args.branching,
+                       args.corridors, args.width)
+    print(f"Wrote {count} rooms to {args.output_file} ({time.perf_counter() - start:.1f}s)")
@@ -0,0 +1,158 @@
+"""
+Reading and writing adventure maps.
+
+Maps come in two formats:
+
+* text: the Python literal used by the files in maps/, a dictionary of
+  room ID -> [(x, y), {direction: room ID}].
+* binary: an 8 byte magic, a header struct and then seven little-endian
+  int64 values per room: ID, x, y and the room to the n, s, e and w
+  (-1 for no exit).
+
+read_map parses a text map once and caches it in the binary format next
+to the source (maps/main_maze.txt -> maps/main_maze.map). Later reads
+load the cache instead, until the source file changes.
+"""
+import os
+import struct
+import sys
+from array import array
+from ast import literal_eval
+from .room import DIRECTIONS
+
+MAP_MAGIC = b'ADVMAP01'
+# Magic, room count, then the size and mtime of the text source the map
+# was cached from (0 for maps written directly)
+MAP_HEADER = struct.Struct('<8sqqq')
+MAP_EXTENSION = '.map'
+FIELDS = 3 + len(DIRECTIONS)
+# Rooms per write when streaming a binary map
+CHUNK_ROOMS = 65536
+
+
+def cache_path(path):
+    return os.path.splitext(path)[0] + MAP_EXTENSION
+
+
+def is_binary_map(path):
+    with open(path, 'rb') as f:
+        return f.read(len(MAP_MAGIC)) == MAP_MAGIC
+
+
+def read_map(path, cache=True):
+    """
+    Return the room graph stored at path in either format, as the same
+    dictionary literal_eval gives for a text map.
+
+    With cache=True a text map is read from its binary cache when that is
+    up to date, and the cache is (re)written after parsing otherwise.
+    """
+    if is_binary_map(path):
+        return _read_binary(path)[0]
+
+    source = os.stat(path)
+    cached = cache_path(path)
+    if cache and os.path.exists(cached):
+        try:
+            room_graph, size, mtime = _read_binary(cached)
+        except (ValueError, struct.error, OSError):
+            # A damaged or foreign cache is replaced below
+            size = mtime = None
+        if (size, mtime) == (source.st_size, source.st_mtime_ns):
+            return room_graph
+
+    with open(path) as f:
+        room_graph = literal_eval(f.read())
+
+    if cache:
+        try:
+            write_map(cached, room_graph, source)
+        except OSError:
+            # A read-only maps directory only costs the speedup
+            pass
+    return room_graph
+
+
+def write_map(path, room_graph, source=None):
+    """
+    Write room_graph to path in the binary format. source is the os.stat
+    result of the text map it was parsed from, when writing a cache.
+    """
+    rooms = ((room_id, coords, exits) for room_id, (coords, exits) in room_graph.items())
+    return write_rooms(path, rooms, source)
+
+
+def write_rooms(path, rooms, source=None):
+    """
+    Stream (room_id, (x, y), exits) tuples from any iterable to path in
+    the binary format, CHUNK_ROOMS at a time. Returns the number of rooms.
+    """
+    size, mtime = (source.st_size, source.st_mtime_ns) if source is not None else (0, 0)
+    count = 0
+    # Write then rename, so a reader never sees half a file
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, 'wb') as f:
+        # The room count is filled in once known
+        f.write(MAP_HEADER.pack(MAP_MAGIC, 0, size, mtime))
+        values = array('q')
+        for room_id, (x, y), exits in rooms:
+            values.extend((room_id, x, y))
+            values.extend(exits.get(direction, -1) for direction in DIRECTIONS)
+            count += 1
+            if len(values) >= CHUNK_ROOMS * FIELDS:
+                _write_chunk(f, values)
+                values = array('q')
+        _write_chunk(f, values)
+        f.seek(0)
+        f.write(MAP_HEADER.pack(MAP_MAGIC, count, size, mtime))
+    os.replace(temporary, path)
+    return count
+
+
+def write_text_map(path, rooms):
+    """
+    Stream (room_id, (x, y), exits) tuples from any iterable to path in
+    the text format, one room per line like the files in maps/. Returns
+    the number of rooms.
+    """
+    count = 0
+    with open(path, 'w') as f:
+        f.write("{")
+        for room_id, (x, y), exits in rooms:
+            f.write(",\n" if count else "\n")
+            f.write(f"  {room_id}: [({x}, {y}), {exits!r}]")
+            count += 1
+        f.write("\n}\n")
+    return count
+
+
+def _write_chunk(f, values):
+    if sys.byteorder != 'little':
+        values.byteswap()
+    f.write(values.tobytes())
+
+
+def _read_binary(path):
+    with open(path, 'rb') as f:
+        data = f.read()
+    magic, num_rooms, size, mtime = MAP_HEADER.unpack_from(data)
+    if magic != MAP_MAGIC:
+        raise ValueError(f"{path} is not a binary map")
+
+    values = array('q')
+    values.frombytes(data[MAP_HEADER.size:])
+    if len(values) != num_rooms * FIELDS:
+        raise ValueError(f"{path} is truncated")
+    if sys.byteorder != 'little':
+        values.byteswap()
+
+    values = values.tolist()
+    room_graph = {}
+    for i in range(0, len(values), FIELDS):
+        room_id, x, y, n, s, e, w = values[i:i + FIELDS]
+        exits = {}
+        for direction, neighbor in zip(DIRECTIONS, (n, s, e, w)):
+            if neighbor != -1:
+                exits[direction] = neighbor
+        room_graph[room_id] = [(x, y), exits]
+    return room_graph, size, mtime
@@ -0,0 +1,135 @@
+import random
+
+from ..util import Queue, instrumented
+
+
+class Navigation:
+    # Explores the map by walking player, recording moves in traversal_path.
+    # Pass stats=SearchStats() (from util) to instrument the backtrack
+    # searches. Its counters describe the latest search only; give it a
+    # callback to collect every search as it finishes.
+    # num_rooms lets traversal stop as soon as every room has been seen.
+    # rng (a random.Random) makes the random choices reproducible.
+    def __init__(self, player, stats=None, num_rooms=None, rng=None):
+        self.player = player
+        self.traversal_path = []
+        self.rng = rng if rng is not None else random.Random()
+        self.rooms = {}
+        # IDs of rooms that still have a "?" exit
+        self.unexplored = set()
+        self.stats = stats
+        self.num_rooms = num_rooms
+
+    def add_room(self, room_id):
+        get_exits = self.player.current_room.get_exits()
+        # Temporary dictionary which holds exits
+        exits = {}
+        # Sets each room's keys and values
+        for direction in get_exits:
+            exits[direction] = "?"
+        self.rooms[room_id] = exits
+        if exits:
+            self.unexplored.add(room_id)
+
+    # Records that direction from room_id leads to next_room_id and back
+    def connect_rooms(self, room_id, direction, next_room_id):
+        self.rooms[room_id][direction] = next_room_id
+        self.rooms[next_room_id][self.set_direction(direction)] = room_id
+        # At most four exits to check, so this stays constant time
+        for room in (room_id, next_room_id):
+            if "?" not in self.rooms[room].values():
+                self.unexplored.discard(room)
+
+    # Returns opposite direction of random direction
+    def set_direction(self, random_direction):
+        opposite_direction = None
+
+        if random_direction == "n":
+            opposite_direction = "s"
+        elif random_direction == "s":
+            opposite_direction = "n"
+        elif random_direction == "w":
+            opposite_direction = "e"
+        elif random_direction == "e":
+            opposite_direction = "w"
+        return opposite_direction
+
+    # Early-exit BFS returning the directions to the closest room with a "?"
+    @instrumented
+    def nearest_unexplored(self, starting_room, stats=None):
+        if starting_room in self.unexplored:
+            return []
+
+        queue = Queue()
+        # Each reached room maps to the (room ID, direction) step into it
+        parents = {starting_room: None}
+        queue.enqueue(starting_room)
+
+        while queue.size() > 0:
+            room_id = queue.dequeue()
+            room_exits = self.rooms[room_id]
+            if stats is not None:
+                stats.expand(len(room_exits), queue.size())
+
+            for direction, next_room in room_exits.items():
+                if next_room == "?" or next_room in parents:
+                    continue
+                parents[next_room] = (room_id, direction)
+                # Rooms are found in order of distance, so stop at the first
+                if next_room in self.unexplored:
+                    directions = []
+                    while parents[next_room] is not None:
+                        next_room, direction = parents[next_room]
+                        directions.append(direction)
+                    directions.reverse()
+                    return directions
+                queue.enqueue(next_room)
+
+        return None
+
+    def traverse_map(self, room_id=None):
+        room_id = self.player.current_room.id
+
+        # Adds room if not in dictionary
+        if room_id not in self.rooms:
+            self.add_room(room_id)
+
+        while self.unexplored and len(self.rooms) != self.num_rooms:
+            prev_room_id = self.player.current_room.id
+
+            # Dead end, walk back to the nearest room with a "?"
+            if prev_room_id not in self.unexplored:
+                for direction in self.nearest_unexplored(prev_room_id, stats=self.stats):
+                    self.player.travel(direction)
+                    self.traversal_path.append(direction)
+                continue
+
+            # Chooses a random unexplored room to travel to
+            question_mark_arr = [key for key, value in self.rooms[prev_room_id].items() if value == "?"]
+            random_direction = self.choose_direction(question_mark_arr)
+
+            self.player.travel(random_direction)
+            self.traversal_path.append(random_direction)
+
+            curr_id = self.player.current_room.id
+            if curr_id not in self.rooms:
+                self.add_room(curr_id)
+
+            self.connect_rooms(prev_room_id, random_direction, curr_id)
+
+        return self.traversal_path
+
+    # Picks which unexplored exit of the current room to take next
+    def choose_direction(self, directions):
+        return self.rng.choice(directions)
+
+
+class DeadEndFirstNavigation(Navigation):
+    # Peeks through each unexplored exit and takes the one leading to the
+    # room with the fewest exits, so dead ends are cleared on the way past
+    # instead of needing a walk back later
+    def choose_direction(self, directions):
+        room = self.player.current_room
+        fewest = min(len(room.get_room_in_direction(d).get_exits()) for d in directions)
+        return self.rng.choice([d for d in directions
+                                if len(room.get_room_in_direction(d).get_exits()) == fewest])
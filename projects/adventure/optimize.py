@@ -0,0 +1,100 @@
+"""
+Search for a short traversal_path by running many seeded traversals
+across a pool of worker processes and keeping the shortest valid one.
+
+Every candidate is fully determined by its (strategy, seed) pair, so the
+winner can be reproduced with Simulation(world, strategy).run(seed).
+
+Run from the repository root with:
+    python3 -m projects.adventure.optimize [map_file] [--seeds N] [--workers N] [--seconds S]
+"""
+import argparse
+import multiprocessing
+import os
+import time
+
+from .mapfile import read_map
+from .simulation import STRATEGIES, Simulation, load_world
+from .replay import PathValidator
+
+
+# World and its path validator, loaded once in each worker process
+_world = None
+_validator = None
+
+
+def _load_worker(room_graph):
+    global _world, _validator
+    _world = load_world(room_graph)
+    _validator = PathValidator(_world)
+
+
+def _run_task(task):
+    strategy, seed = task
+    result = Simulation(_world, strategy, _validator).run(seed)
+    return strategy, seed, result.path, result.complete
+
+
+def optimize(room_graph, seeds=100, strategies=tuple(STRATEGIES), workers=None, seconds=None, first_seed=0):
+    """
+    Try every strategy with seeds first_seed .. first_seed + seeds - 1 and
+    return (path, strategy, seed) for the shortest valid traversal found.
+
+    Candidates run in workers processes (one per CPU by default). With
+    seconds set, no new results are taken once the time budget is spent.
+    Ties are broken by seed then strategy order, so a run that finishes
+    every candidate always returns the same answer.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    tasks = [(strategy, first_seed + i) for i in range(seeds) for strategy in strategies]
+    deadline = time.perf_counter() + seconds if seconds is not None else None
+
+    best = None
+    best_key = None
+    pool = None
+    try:
+        if workers <= 1:
+            _load_worker(room_graph)
+            results = map(_run_task, tasks)
+        else:
+            pool = multiprocessing.Pool(workers, initializer=_load_worker, initargs=(room_graph,))
+            results = pool.imap_unordered(_run_task, tasks, max(1, len(tasks) // (workers * 16)))
+
+        for strategy, seed, path, valid in results:
+            key = (len(path), seed, strategies.index(strategy))
+            if valid and (best_key is None or key < best_key):
+                best, best_key = (path, strategy, seed), key
+            if deadline is not None and time.perf_counter() > deadline:
+                break
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+    return best
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("map_file", nargs="?", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "maps", "main_maze.txt"))
+    parser.add_argument("--seeds", type=int, default=200)
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seconds", type=float, default=None)
+    parser.add_argument("--strategies", nargs="+", default=list(STRATEGIES), choices=list(STRATEGIES))
+    args = parser.parse_args()
+
+    room_graph = read_map(args.map_file)
+
+    start = time.perf_counter()
+    best = optimize(room_graph, args.seeds, tuple(args.strategies), args.workers,
+                    args.seconds, args.first_seed)
+    elapsed = time.perf_counter() - start
+
+    if best is None:
+        print("No valid traversal found")
+    else:
+        path, strategy, seed = best
+        print(f"{len(path)} moves with {strategy} seed {seed} ({elapsed:.1f}s)")
+        print(path)
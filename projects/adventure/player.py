@@ -1,11 +1,17 @@
 class Player:
-    def __init__(self, starting_room):
+    # verbose=False silences the message for invalid moves, for batch runs
+    def __init__(self, starting_room, verbose=True):
         self.current_room = starting_room
+        self.verbose = verbose
+    # Returns whether the move was possible
     def travel(self, direction, show_rooms = False):
         next_room = self.current_room.get_room_in_direction(direction)
         if next_room is not None:
             self.current_room = next_room
             if (show_rooms):
                 next_room.print_room_description(self)
+            return True
         else:
-            print("You cannot move in that direction.")
+            if self.verbose:
+                print("You cannot move in that direction.")
+            return False
@@ -0,0 +1,205 @@
+"""
+Fast replay of traversal paths, for checking and scoring many candidate
+paths against one World.
+"""
+from .room import DIRECTIONS, DIRECTION_INDEX
+
+try:
+    import numpy as np
+except ImportError:  # NumPy only speeds up PathValidator.validate
+    np = None
+
+
+# Direction letter byte -> slot in World.neighbors, 255 for anything else
+INVALID_CODE = 255
+_CODES = bytes(DIRECTION_INDEX.get(chr(byte), INVALID_CODE) for byte in range(256))
+# (dx, dy) of a move through each slot
+DELTAS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+# Use a dense grid of rooms when it has at most this many squares per room
+DENSE_GRID_FACTOR = 8
+# Moves replayed per vectorized step
+REPLAY_CHUNK = 1 << 16
+
+
+def encode_path(path):
+    """
+    Return a list of directions as bytes holding each direction's slot
+    (0-3), with INVALID_CODE for anything that is not a direction.
+    """
+    try:
+        joined = "".join(path)
+    except TypeError:
+        joined = None
+    if joined is not None and len(joined) == len(path) and joined.isascii():
+        return joined.encode('ascii').translate(_CODES)
+    return bytes(DIRECTION_INDEX.get(direction, INVALID_CODE) for direction in path)
+
+
+class ReplayResult:
+    """Outcome of replaying one path from the starting room."""
+    def __init__(self, moves, rooms_visited, num_rooms, invalid_move):
+        self.moves = moves
+        self.rooms_visited = rooms_visited
+        self.num_rooms = num_rooms
+        # Index of the first impossible move, or None; the replay stops there
+        self.invalid_move = invalid_move
+    @property
+    def coverage(self):
+        return self.rooms_visited / self.num_rooms if self.num_rooms else 1.0
+    @property
+    def complete(self):
+        return self.invalid_move is None and self.rooms_visited == self.num_rooms
+    def __repr__(self):
+        return (f"ReplayResult(moves={self.moves}, rooms_visited={self.rooms_visited}/{self.num_rooms}, "
+                f"invalid_move={self.invalid_move})")
+
+
+class PathValidator:
+    """
+    Replays paths over the World.neighbors transition table instead of
+    Room objects, with directions encoded as slot numbers.
+
+    Build one per World and call validate for each path. With NumPy, and
+    when every exit leads to the adjacent grid square (true of all the
+    bundled maps), the whole path is checked at once: the positions it
+    walks through are a cumulative sum of move deltas, and each move is
+    then checked against the table in a single vectorized comparison.
+    Otherwise, or with vectorized=False, the table is walked one move at
+    a time.
+    """
+    def __init__(self, world, vectorized=True):
+        self.neighbors = world.neighbors
+        self.start = world.starting_room.id
+        self.num_rooms = len(world.rooms)
+        self._grid = None
+        if vectorized and np is not None and world.rooms:
+            self._grid = self._grid_index(world)
+
+    def _grid_index(self, world):
+        """
+        Return the arrays for the vectorized replay, or None if some exit
+        does not lead to the adjacent square or two rooms share a square.
+        """
+        ids = np.fromiter(world.rooms, dtype=np.int64, count=len(world.rooms))
+        xs = np.fromiter((room.x for room in world.rooms.values()), dtype=np.int64, count=len(ids))
+        ys = np.fromiter((room.y for room in world.rooms.values()), dtype=np.int64, count=len(ids))
+        table = np.frombuffer(self.neighbors, dtype=np.int32).reshape(-1, len(DIRECTIONS))
+
+        # Room coordinates indexed by room ID, for checking every exit
+        room_x = np.zeros(len(table), dtype=np.int64)
+        room_y = np.zeros(len(table), dtype=np.int64)
+        room_x[ids], room_y[ids] = xs, ys
+        dx = np.array([delta[0] for delta in DELTAS], dtype=np.int64)
+        dy = np.array([delta[1] for delta in DELTAS], dtype=np.int64)
+        exits = table[ids] >= 0
+        targets = table[ids].astype(np.int64)
+        if not (np.all((room_x[targets] == (xs[:, None] + dx))[exits])
+                and np.all((room_y[targets] == (ys[:, None] + dy))[exits])):
+            return None
+
+        # Rooms by square: a dense x-major grid of room IDs when the map is
+        # compact enough, else sorted integer keys searched with searchsorted
+        x_min, y_min = xs.min(), ys.min()
+        span = int(ys.max() - y_min + 1)
+        area = int(xs.max() - x_min + 1) * span
+        keys = (xs - x_min) * span + (ys - y_min)
+        room_keys = np.zeros(len(table), dtype=np.int64)
+        room_keys[ids] = keys
+        if area <= DENSE_GRID_FACTOR * len(ids):
+            squares = np.full(area, -1, dtype=np.int64)
+            squares[keys] = ids
+            if np.count_nonzero(squares >= 0) < len(ids):
+                return None
+            keys = None
+        else:
+            order = np.argsort(keys)
+            keys, squares = keys[order], ids[order]
+            if np.any(keys[1:] == keys[:-1]):
+                return None
+        return {
+            "table": table, "dx": dx, "dy": dy, "keys": keys, "squares": squares,
+            "room_keys": room_keys, "span": span,
+        }
+
+    def validate(self, path):
+        """
+        Replay path (a list of directions, or bytes from encode_path) from
+        the starting room and return a ReplayResult.
+        """
+        codes = path if isinstance(path, bytes) else encode_path(path)
+        if self._grid is not None and codes:
+            return self._validate_vectorized(codes)
+        return self._validate_loop(codes)
+
+    def _validate_loop(self, codes):
+        table = self.neighbors
+        room = self.start
+        seen = bytearray(len(table) // len(DIRECTIONS))
+        seen[room] = 1
+        visited = 1
+        for i, code in enumerate(codes):
+            if code >= len(DIRECTIONS):
+                return ReplayResult(len(codes), visited, self.num_rooms, i)
+            room = table[4 * room + code]
+            if room < 0:
+                return ReplayResult(len(codes), visited, self.num_rooms, i)
+            if not seen[room]:
+                seen[room] = 1
+                visited += 1
+        return ReplayResult(len(codes), visited, self.num_rooms, None)
+
+    def _validate_vectorized(self, codes):
+        grid = self._grid
+        codes = np.frombuffer(codes, dtype=np.uint8)
+        seen = np.zeros(len(grid["table"]), dtype=bool)
+        seen[self.start] = True
+        room = self.start
+
+        # Chunks bound the memory used and let a path that goes wrong early
+        # stop early
+        for first in range(0, len(codes), REPLAY_CHUNK):
+            chunk = codes[first:first + REPLAY_CHUNK]
+            rooms, stop = self._replay_chunk(room, chunk)
+            seen[rooms[:stop]] = True
+            if stop < len(chunk):
+                return ReplayResult(len(codes), int(seen.sum()), self.num_rooms, first + stop)
+            room = int(rooms[-1])
+
+        return ReplayResult(len(codes), int(seen.sum()), self.num_rooms, None)
+
+    def _replay_chunk(self, room, codes):
+        """
+        Replay codes from room. Returns the room reached by every move and
+        the index of the first impossible one (len(codes) if none); entries
+        from that index on are meaningless.
+        """
+        grid = self._grid
+        # Anything that is not a direction ends the replay before it is
+        # looked up
+        stop = len(codes)
+        bad = codes >= len(DIRECTIONS)
+        if bad.any():
+            stop = int(bad.argmax())
+            codes = codes[:stop]
+
+        # The square after every move, assuming each move is possible
+        x0, y0 = divmod(int(grid["room_keys"][room]), grid["span"])
+        xs = x0 + np.cumsum(grid["dx"][codes])
+        ys = y0 + np.cumsum(grid["dy"][codes])
+        keys = xs * grid["span"] + ys
+        if grid["keys"] is None:
+            # Moves off the grid are caught below before their room is used
+            rooms = grid["squares"][np.clip(keys, 0, len(grid["squares"]) - 1)]
+        else:
+            positions = np.minimum(np.searchsorted(grid["keys"], keys), len(grid["keys"]) - 1)
+            rooms = np.where(grid["keys"][positions] == keys, grid["squares"][positions], -1)
+
+        # Move i is possible when the room it leaves has an exit that way;
+        # the exits agree with the grid, so that exit leads to rooms[i].
+        previous = np.empty(len(rooms), dtype=np.int64)
+        previous[:1] = room
+        previous[1:] = rooms[:-1]
+        invalid = grid["table"][previous, codes] < 0
+        if invalid.any():
+            stop = int(invalid.argmax())
+        return rooms, stop
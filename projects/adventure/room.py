@@ -1,6 +1,21 @@
+# Slot of each direction in each row of World.neighbors. Opposite
+# directions share a pair, so the slot of a direction's opposite is its
+# own slot ^ 1.
+DIRECTIONS = ("n", "s", "e", "w")
+DIRECTION_INDEX = {direction: i for i, direction in enumerate(DIRECTIONS)}
+# Room attribute holding the connected room for each slot
+NEIGHBOR_ATTRIBUTES = ("n_to", "s_to", "e_to", "w_to")
+# Slots in the order get_exits lists them
+EXIT_ORDER = (0, 1, 3, 2)
+# Every possible exits tuple, indexed by a bitmask of open slots, so rooms
+# share them instead of each holding its own
+EXITS = tuple(tuple(DIRECTIONS[i] for i in EXIT_ORDER if mask & (1 << i)) for mask in range(16))
+
+
 # Implement a class to hold room information. This should have name and
 # description attributes.
 class Room:
+    __slots__ = ("id", "name", "description", "n_to", "s_to", "e_to", "w_to", "x", "y")
     def __init__(self, name, description, id=0, x=None, y=None):
         self.id = id
         self.name = name
@@ -16,35 +31,30 @@ class Room:
     def print_room_description(self, player):
         print(str(self))
     def get_exits(self):
-        exits = []
+        # One of the shared EXITS tuples, picked from the neighbor slots on
+        # every call so it allocates nothing and can never go stale
+        mask = 0
         if self.n_to is not None:
-            exits.append("n")
+            mask |= 1
         if self.s_to is not None:
-            exits.append("s")
-        if self.w_to is not None:
-            exits.append("w")
+            mask |= 2
         if self.e_to is not None:
-            exits.append("e")
-        return exits
+            mask |= 4
+        if self.w_to is not None:
+            mask |= 8
+        return EXITS[mask]
     def get_exits_string(self):
         return f"Exits: [{', '.join(self.get_exits())}]"
     def connect_rooms(self, direction, connecting_room):
-        if direction == "n":
-            self.n_to = connecting_room
-            connecting_room.s_to = self
-        elif direction == "s":
-            self.s_to = connecting_room
-            connecting_room.n_to = self
-        elif direction == "e":
-            self.e_to = connecting_room
-            connecting_room.w_to = self
-        elif direction == "w":
-            self.w_to = connecting_room
-            connecting_room.e_to = self
-        else:
+        i = DIRECTION_INDEX.get(direction)
+        if i is None:
             print("INVALID ROOM CONNECTION")
             return None
+        setattr(self, NEIGHBOR_ATTRIBUTES[i], connecting_room)
+        setattr(connecting_room, NEIGHBOR_ATTRIBUTES[i ^ 1], self)
     def get_room_in_direction(self, direction):
+        # Comparing against four interned strings and reading a slot beats
+        # a dictionary lookup plus an index or attrgetter call in CPython
         if direction == "n":
             return self.n_to
         elif direction == "s":
@@ -0,0 +1,197 @@
+"""
+Headless traversal runs: load a World once and run any number of seeded
+traversal strategies against it without printing or touching module
+globals, for batch experiments such as optimize.py.
+"""
+import random
+import time
+
+from .player import Player
+from .world import World
+from .navigation import Navigation, DeadEndFirstNavigation
+from .replay import PathValidator
+from ..util import Queue
+
+
+def load_world(room_graph):
+    world = World()
+    world.load_graph(room_graph)
+    return world
+
+
+def explore(world, rng, navigation_class=Navigation):
+    """
+    Explore the map room by room as a player who only sees the exits of
+    rooms already reached.
+    """
+    player = Player(world.starting_room, verbose=False)
+    navigate = navigation_class(player, num_rooms=len(world.rooms), rng=rng)
+    return navigate.traverse_map()
+
+
+def dead_end_first(world, rng):
+    return explore(world, rng, DeadEndFirstNavigation)
+
+
+def tree_route(world, rng):
+    """
+    Walk a random spanning tree of the whole (already known) map.
+
+    Subtrees are visited shortest first so the walk ends at the bottom of
+    the tallest one and never has to come back from it. Moving on to the
+    next subtree takes the shortest route in the full map, which can cut
+    across loops instead of retracing tree edges.
+    """
+    start = world.starting_room
+
+    # Randomized depth-first spanning tree
+    parent = {start.id: None}
+    children = {start.id: []}
+    stack = [start]
+    while stack:
+        room = stack[-1]
+        options = [room.get_room_in_direction(d) for d in room.get_exits()]
+        options = [option for option in options if option.id not in parent]
+        if options:
+            child = rng.choice(options)
+            parent[child.id] = room.id
+            children[room.id].append(child.id)
+            children[child.id] = []
+            stack.append(child)
+        else:
+            stack.pop()
+
+    # Rooms were discovered parents first, so reversed order is bottom-up
+    height = {}
+    for room_id in reversed(list(parent)):
+        height[room_id] = 1 + max((height[child] for child in children[room_id]), default=-1)
+
+    # Preorder with the tallest subtree of each room visited last
+    targets = []
+    stack = [start.id]
+    while stack:
+        room_id = stack.pop()
+        targets.append(room_id)
+        kids = list(children[room_id])
+        rng.shuffle(kids)
+        kids.sort(key=lambda child: height[child], reverse=True)
+        stack.extend(kids)
+
+    path = []
+    visited = {start.id}
+    current = start
+    for target in targets:
+        if target in visited:
+            continue
+        for direction, room in _route(current, target):
+            path.append(direction)
+            visited.add(room.id)
+            current = room
+    return path
+
+
+def _route(start, target_id):
+    """
+    Return the (direction, room) steps of a shortest walk from start to
+    the room with ID target_id.
+    """
+    queue = Queue()
+    queue.enqueue(start)
+    parents = {start.id: None}
+
+    while queue.size() > 0:
+        room = queue.dequeue()
+        if room.id == target_id:
+            steps = []
+            while parents[room.id] is not None:
+                prev_room, direction = parents[room.id]
+                steps.append((direction, room))
+                room = prev_room
+            steps.reverse()
+            return steps
+        for direction in room.get_exits():
+            next_room = room.get_room_in_direction(direction)
+            if next_room.id not in parents:
+                parents[next_room.id] = (room, direction)
+                queue.enqueue(next_room)
+
+
+# Strategy name -> function(world, rng) returning a list of directions
+STRATEGIES = {
+    "explore": explore,
+    "dead_end_first": dead_end_first,
+    "tree_route": tree_route,
+}
+
+
+class SimulationResult:
+    """Outcome of one Simulation.run."""
+    def __init__(self, strategy, seed, path, replay, elapsed):
+        self.strategy = strategy
+        self.seed = seed
+        self.path = path
+        # replay.ReplayResult of path from the starting room
+        self.replay = replay
+        self.elapsed = elapsed
+    @property
+    def moves(self):
+        return len(self.path)
+    @property
+    def rooms_visited(self):
+        return self.replay.rooms_visited
+    @property
+    def num_rooms(self):
+        return self.replay.num_rooms
+    @property
+    def invalid_move(self):
+        return self.replay.invalid_move
+    @property
+    def coverage(self):
+        return self.replay.coverage
+    @property
+    def complete(self):
+        return self.replay.complete
+    def __repr__(self):
+        return (f"SimulationResult(strategy={self.strategy!r}, seed={self.seed!r}, moves={self.moves}, "
+                f"rooms_visited={self.rooms_visited}/{self.num_rooms}, invalid_move={self.invalid_move})")
+
+
+class Simulation:
+    """
+    Run a traversal strategy on a loaded World.
+
+    strategy is a name from STRATEGIES or any function(world, rng) that
+    returns a list of directions. The world's rooms are only read, so one
+    World can back many simulations; pass them a shared validator (a
+    replay.PathValidator of world) to build its tables only once.
+    """
+    def __init__(self, world, strategy="explore", validator=None):
+        self.world = world
+        self.validator = validator if validator is not None else PathValidator(world)
+        if isinstance(strategy, str):
+            if strategy not in STRATEGIES:
+                raise ValueError(f"Unknown strategy: {strategy}")
+            self.name = strategy
+            strategy = STRATEGIES[strategy]
+        else:
+            self.name = getattr(strategy, "__name__", repr(strategy))
+        self.strategy = strategy
+
+    def run(self, seed=None):
+        """
+        Run the strategy with random.Random(seed), replay the path it
+        returns from the starting room and return a SimulationResult.
+        """
+        start = time.perf_counter()
+        path = self.strategy(self.world, random.Random(seed))
+        elapsed = time.perf_counter() - start
+        return SimulationResult(self.name, seed, path, self.replay(path), elapsed)
+
+    def replay(self, path):
+        """Replay path from the starting room and return a ReplayResult."""
+        return self.validator.validate(path)
+
+    def run_many(self, seeds):
+        """Generate a SimulationResult for each seed in turn."""
+        for seed in seeds:
+            yield self.run(seed)
@@ -0,0 +1,63 @@
+import os
+import tempfile
+import unittest
+from collections import deque
+from .generate import generate_rooms, write_maze
+from .mapfile import read_map
+
+OPPOSITE = {'n': 's', 's': 'n', 'e': 'w', 'w': 'e'}
+STEP = {'n': (0, 1), 's': (0, -1), 'e': (1, 0), 'w': (-1, 0)}
+
+class Test(unittest.TestCase):
+    def check_maze(self, num_rooms, **options):
+        rooms = {room_id: (coords, exits) for room_id, coords, exits in generate_rooms(num_rooms, **options)}
+        self.assertEqual(sorted(rooms), list(range(num_rooms)))
+
+        for room_id, ((x, y), exits) in rooms.items():
+            for direction, neighbor in exits.items():
+                # Exits are symmetric and lead to the adjacent square
+                self.assertEqual(rooms[neighbor][1].get(OPPOSITE[direction]), room_id)
+                dx, dy = STEP[direction]
+                self.assertEqual(rooms[neighbor][0], (x + dx, y + dy))
+
+        # Every room is reachable from room 0
+        seen = {0}
+        queue = deque([0])
+        while queue:
+            for neighbor in rooms[queue.popleft()][1].values():
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    queue.append(neighbor)
+        self.assertEqual(len(seen), num_rooms)
+
+        return sum(len(exits) for _, exits in rooms.values()) // 2
+
+    def test_spanning_tree_without_loops(self):
+        for num_rooms in range(1, 260):
+            for width in (None, 1, 3, 7):
+                edges = self.check_maze(num_rooms, seed=num_rooms, width=width)
+                self.assertEqual(edges, num_rooms - 1)
+        for num_rooms in (1000, 4097):
+            self.assertEqual(self.check_maze(num_rooms, seed=1), num_rooms - 1)
+            self.assertEqual(self.check_maze(num_rooms, seed=2, corridors=0.0, branching=1.0), num_rooms - 1)
+            self.assertEqual(self.check_maze(num_rooms, seed=3, corridors=1.0, branching=0.0), num_rooms - 1)
+
+    def test_loops_add_cycles(self):
+        self.assertGreater(self.check_maze(1000, seed=1, loops=0.3), 999)
+
+    def test_seeded(self):
+        self.assertListEqual(list(generate_rooms(500, seed=4)), list(generate_rooms(500, seed=4)))
+        self.assertNotEqual(list(generate_rooms(500, seed=4)), list(generate_rooms(500, seed=5)))
+        self.assertListEqual(list(generate_rooms(0)), [])
+
+    def test_write_both_formats(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            text, binary = os.path.join(tmp, "maze.txt"), os.path.join(tmp, "other.map")
+            self.assertEqual(write_maze(text, 300, seed=9), 300)
+            self.assertEqual(write_maze(binary, 300, seed=9), 300)
+            expected = {room_id: [coords, exits] for room_id, coords, exits in generate_rooms(300, seed=9)}
+            self.assertDictEqual(read_map(text, cache=False), expected)
+            self.assertDictEqual(read_map(binary), expected)
+
+if __name__ == '__main__':
+    unittest.main()
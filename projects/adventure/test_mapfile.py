@@ -0,0 +1,61 @@
+import os
+import tempfile
+import unittest
+from .mapfile import cache_path, read_map, write_map, write_text_map
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "maze.txt")
+        self.room_graph = {
+            0: [(3, 5), {'n': 1, 'e': 2}],
+            1: [(3, 6), {'s': 0}],
+            2: [(4, 5), {'w': 0}],
+        }
+        self.write_text(self.room_graph)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write_text(self, room_graph):
+        write_text_map(self.path, ((room_id, coords, exits) for room_id, (coords, exits) in room_graph.items()))
+
+    def test_round_trip(self):
+        binary = os.path.join(self.tmp.name, "other.map")
+        write_map(binary, self.room_graph)
+        self.assertDictEqual(read_map(binary), self.room_graph)
+        self.assertDictEqual(read_map(self.path, cache=False), self.room_graph)
+        self.assertFalse(os.path.exists(cache_path(self.path)))
+
+    def test_cache_reused_while_source_unchanged(self):
+        self.assertDictEqual(read_map(self.path), self.room_graph)
+        self.assertTrue(os.path.exists(cache_path(self.path)))
+        # A cache stamped with the source's size and mtime is trusted as is
+        marker = {0: [(0, 0), {}]}
+        write_map(cache_path(self.path), marker, os.stat(self.path))
+        self.assertDictEqual(read_map(self.path), marker)
+
+    def test_cache_refreshed_after_source_changes(self):
+        read_map(self.path)
+        changed = {0: [(1, 1), {}]}
+        self.write_text(changed)
+        self.assertDictEqual(read_map(self.path), changed)
+        # The refreshed cache is then used
+        write_map(cache_path(self.path), self.room_graph, os.stat(self.path))
+        self.assertDictEqual(read_map(self.path), self.room_graph)
+
+    def test_damaged_cache_is_replaced(self):
+        cached = cache_path(self.path)
+        with open(cached, 'wb') as f:
+            f.write(b'garbage')
+        self.assertDictEqual(read_map(self.path), self.room_graph)
+
+        # Right magic, wrong length
+        write_map(cached, self.room_graph, os.stat(self.path))
+        with open(cached, 'r+b') as f:
+            f.truncate(os.path.getsize(cached) - 8)
+        self.assertDictEqual(read_map(self.path), self.room_graph)
+        self.assertDictEqual(read_map(cached), self.room_graph)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import os
+import random
+import unittest
+from .generate import generate_rooms
+from .mapfile import read_map
+from .navigation import Navigation
+from .player import Player
+from .replay import PathValidator
+from .simulation import load_world
+from ..util import SearchStats
+
+MAPS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'maps')
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        self.worlds = {}
+        for name in sorted(os.listdir(MAPS)):
+            if name.endswith('.txt'):
+                self.worlds[name] = load_world(read_map(os.path.join(MAPS, name), cache=False))
+        maze = {room_id: [coords, exits] for room_id, coords, exits in generate_rooms(2000, seed=11, loops=0.2)}
+        self.worlds["generated"] = load_world(maze)
+
+    def traverse(self, world, seed, num_rooms=None):
+        player = Player(world.starting_room, verbose=False)
+        navigation = Navigation(player, num_rooms=num_rooms, rng=random.Random(seed))
+        return navigation, navigation.traverse_map()
+
+    def test_traverse_map_visits_every_room(self):
+        for name, world in self.worlds.items():
+            validator = PathValidator(world)
+            for seed in range(5):
+                with self.subTest(map=name, seed=seed):
+                    navigation, path = self.traverse(world, seed, len(world.rooms))
+                    self.assertTrue(validator.validate(path).complete)
+                    self.assertEqual(len(navigation.rooms), len(world.rooms))
+
+    def test_traverse_map_without_room_count(self):
+        # Without num_rooms traversal runs until no "?" exit is left
+        for name, world in self.worlds.items():
+            with self.subTest(map=name):
+                navigation, path = self.traverse(world, 0)
+                self.assertTrue(PathValidator(world).validate(path).complete)
+                self.assertSetEqual(navigation.unexplored, set())
+                for exits in navigation.rooms.values():
+                    self.assertNotIn("?", exits.values())
+
+    def test_same_seed_same_path(self):
+        world = self.worlds["generated"]
+        self.assertListEqual(self.traverse(world, 3)[1], self.traverse(world, 3)[1])
+
+    def test_stats_callback_sees_every_search(self):
+        world = self.worlds["generated"]
+        searches = []
+        stats = SearchStats(callback=lambda finished: searches.append(finished.as_dict()))
+        player = Player(world.starting_room, verbose=False)
+        Navigation(player, stats=stats, rng=random.Random(1)).traverse_map()
+        self.assertGreater(len(searches), 1)
+        self.assertTrue(all(search["search"] == "nearest_unexplored" for search in searches))
+        # The object itself only holds the last search
+        self.assertDictEqual(stats.as_dict(), searches[-1])
+
+if __name__ == '__main__':
+    unittest.main()
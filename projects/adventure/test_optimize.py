@@ -0,0 +1,57 @@
+import os
+import unittest
+from .mapfile import read_map
+from .optimize import optimize
+from .simulation import STRATEGIES, Simulation, load_world
+
+MAPS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'maps')
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        self.room_graphs = {}
+        for name in sorted(os.listdir(MAPS)):
+            if name.endswith('.txt'):
+                self.room_graphs[name] = read_map(os.path.join(MAPS, name), cache=False)
+        self.room_graph = self.room_graphs["main_maze.txt"]
+        self.world = load_world(self.room_graph)
+
+    def test_same_strategy_and_seed_same_path(self):
+        for strategy in STRATEGIES:
+            with self.subTest(strategy=strategy):
+                first = Simulation(self.world, strategy).run(5)
+                # A separately loaded world gives the same path too
+                second = Simulation(load_world(self.room_graph), strategy).run(5)
+                self.assertListEqual(first.path, second.path)
+                self.assertTrue(first.complete)
+
+    def test_dead_end_first_completes(self):
+        for name, room_graph in self.room_graphs.items():
+            simulation = Simulation(load_world(room_graph), "dead_end_first")
+            for seed in range(5):
+                with self.subTest(map=name, seed=seed):
+                    self.assertTrue(simulation.run(seed).complete)
+
+    def test_optimize_is_deterministic(self):
+        best = optimize(self.room_graph, seeds=4, workers=1)
+        self.assertEqual(optimize(self.room_graph, seeds=4, workers=1), best)
+        self.assertEqual(optimize(self.room_graph, seeds=4, workers=2), best)
+
+        path, strategy, seed = best
+        self.assertIn(strategy, STRATEGIES)
+        self.assertIn(seed, range(4))
+        result = Simulation(self.world, strategy).run(seed)
+        self.assertListEqual(result.path, path)
+        self.assertTrue(result.complete)
+        for other in STRATEGIES:
+            for other_seed in range(4):
+                self.assertGreaterEqual(len(Simulation(self.world, other).run(other_seed).path), len(path))
+
+    def test_optimize_time_budget(self):
+        # A spent budget stops after the first result, the first strategy
+        # on first_seed
+        best = optimize(self.room_graph, seeds=50, workers=1, seconds=0, first_seed=3)
+        strategy = next(iter(STRATEGIES))
+        self.assertEqual(best, (Simulation(self.world, strategy).run(3).path, strategy, 3))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import os
+import random
+import unittest
+from . import replay
+from .generate import generate_rooms
+from .mapfile import read_map
+from .player import Player
+from .replay import PathValidator
+from .simulation import Simulation, load_world
+
+MAPS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'maps')
+
+def player_replay(world, path):
+    """Replay path with Player.travel, returning (rooms visited, first invalid move)."""
+    player = Player(world.starting_room, verbose=False)
+    visited = {player.current_room.id}
+    for i, direction in enumerate(path):
+        if not isinstance(direction, str) or not player.travel(direction):
+            return len(visited), i
+        visited.add(player.current_room.id)
+    return len(visited), None
+
+def random_walk(world, rng, length):
+    room = world.starting_room
+    path = []
+    for _ in range(length):
+        direction = rng.choice(room.get_exits())
+        path.append(direction)
+        room = room.get_room_in_direction(direction)
+    return path
+
+def walled_direction(room):
+    """A direction room has no exit in, or None if it has all four."""
+    return next((d for d in "nsew" if d not in room.get_exits()), None)
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        self.worlds = []
+        for name in sorted(os.listdir(MAPS)):
+            if name.endswith('.txt'):
+                self.worlds.append(load_world(read_map(os.path.join(MAPS, name), cache=False)))
+        maze = {room_id: [coords, exits] for room_id, coords, exits in generate_rooms(3000, seed=7, loops=0.1)}
+        self.worlds.append(load_world(maze))
+
+    def paths(self, world, rng):
+        """Valid and broken paths of many lengths for world."""
+        start = world.starting_room
+        yield []
+        yield ['x']
+        if walled_direction(start) is not None:
+            yield [walled_direction(start)]
+            yield [walled_direction(start), start.get_exits()[0]]
+        for _ in range(40):
+            path = random_walk(world, rng, rng.randrange(1, 300))
+            broken = rng.randrange(4)
+            i = rng.randrange(len(path))
+            if broken == 1:
+                path[i] = rng.choice(['x', 'N', '', 'ne', None])
+            elif broken == 2:
+                # A wall: replay up to i, then try a direction with no exit
+                room = start
+                for direction in path[:i]:
+                    room = room.get_room_in_direction(direction)
+                path[i] = walled_direction(room) or path[i]
+            yield path
+
+    def check(self, long_paths=True, vectorized=True):
+        rng = random.Random(3)
+        for world in self.worlds:
+            validator = PathValidator(world, vectorized)
+            for path in self.paths(world, rng):
+                result = validator.validate(path)
+                self.assertEqual((result.rooms_visited, result.invalid_move), player_replay(world, path))
+                self.assertEqual(result.moves, len(path))
+                self.assertEqual(result.num_rooms, len(world.rooms))
+            if long_paths:
+                # Longer than REPLAY_CHUNK, valid and with a wall late on
+                path = random_walk(world, rng, replay.REPLAY_CHUNK + 5000)
+                expected = player_replay(world, path)
+                self.assertEqual((validator.validate(path).rooms_visited, None), expected)
+                room = world.starting_room
+                for direction in path[:replay.REPLAY_CHUNK + 10]:
+                    room = room.get_room_in_direction(direction)
+                path[replay.REPLAY_CHUNK + 10] = walled_direction(room) or 'x'
+                result = validator.validate(path)
+                self.assertEqual((result.rooms_visited, result.invalid_move), player_replay(world, path))
+
+    @unittest.skipUnless(replay.np is not None, "requires NumPy")
+    def test_vectorized_matches_player(self):
+        for world in self.worlds:
+            self.assertIsNotNone(PathValidator(world)._grid)
+        self.check()
+
+    @unittest.skipUnless(replay.np is not None, "requires NumPy")
+    def test_vectorized_matches_player_across_chunks(self):
+        chunk = replay.REPLAY_CHUNK
+        replay.REPLAY_CHUNK = 16
+        try:
+            self.check(long_paths=False)
+        finally:
+            replay.REPLAY_CHUNK = chunk
+
+    def test_loop_matches_player(self):
+        for world in self.worlds:
+            self.assertIsNone(PathValidator(world, vectorized=False)._grid)
+        self.check(vectorized=False)
+
+    def test_complete_traversal(self):
+        world = self.worlds[0]
+        validator = PathValidator(world)
+        path = Simulation(world, "tree_route", validator).run(0).path
+        result = validator.validate(path)
+        self.assertTrue(result.complete)
+        self.assertEqual(result.coverage, 1.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+from .room import Room
+from .world import World
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        self.a = Room("A", "Room A")
+        self.b = Room("B", "Room B")
+
+    def test_get_exits_after_connect_rooms(self):
+        self.assertEqual(self.a.get_exits(), ())
+        self.a.connect_rooms("n", self.b)
+        self.assertEqual(self.a.get_exits(), ("n",))
+        self.assertEqual(self.b.get_exits(), ("s",))
+        self.a.connect_rooms("w", Room("C", "Room C"))
+        self.a.connect_rooms("e", Room("D", "Room D"))
+        self.assertEqual(self.a.get_exits(), ("n", "w", "e"))
+        self.assertEqual(self.a.get_exits_string(), "Exits: [n, w, e]")
+
+    def test_get_exits_after_direct_assignment(self):
+        self.a.n_to = self.b
+        self.assertEqual(self.a.get_exits(), ("n",))
+        self.a.n_to = None
+        self.a.s_to = self.b
+        self.assertEqual(self.a.get_exits(), ("s",))
+        self.assertEqual(self.b.get_exits(), ())
+
+    def test_loaded_world_exits(self):
+        world = World()
+        world.load_graph({
+            0: [(0, 0), {'n': 1, 'e': 2}],
+            1: [(0, 1), {'s': 0}],
+            2: [(1, 0), {'w': 0}],
+        })
+        self.assertEqual(world.rooms[0].get_exits(), ("n", "e"))
+        self.assertEqual(world.rooms[1].get_exits(), ("s",))
+        self.assertEqual(world.rooms[2].get_exits(), ("w",))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import contextlib
+import io
+import unittest
+from .player import Player
+from .replay import PathValidator
+from .simulation import Simulation, SimulationResult, load_world
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        # 0 - 1 - 2, with 3 north of 1
+        self.world = load_world({
+            0: [(0, 0), {'e': 1}],
+            1: [(1, 0), {'w': 0, 'e': 2, 'n': 3}],
+            2: [(2, 0), {'w': 1}],
+            3: [(1, 1), {'s': 1}],
+        })
+
+    def test_unknown_strategy(self):
+        with self.assertRaises(ValueError):
+            Simulation(self.world, "teleport")
+
+    def test_custom_strategy(self):
+        def east_then_north(world, rng):
+            return ['e', 'e', 'w', 'n']
+        simulation = Simulation(self.world, east_then_north)
+        self.assertEqual(simulation.name, "east_then_north")
+        result = simulation.run(1)
+        self.assertIsInstance(result, SimulationResult)
+        self.assertEqual((result.strategy, result.seed, result.moves), ("east_then_north", 1, 4))
+        self.assertEqual(result.rooms_visited, 4)
+        self.assertTrue(result.complete)
+
+        partial = Simulation(self.world, lambda world, rng: ['e', 's', 'e']).run()
+        self.assertEqual((partial.rooms_visited, partial.invalid_move), (2, 1))
+        self.assertFalse(partial.complete)
+        self.assertEqual(partial.coverage, 0.5)
+
+    def test_run_many_is_deterministic(self):
+        def random_moves(world, rng):
+            return [rng.choice("nsew") for _ in range(20)]
+        validator = PathValidator(self.world)
+        seeds = range(10)
+        first = [result.path for result in Simulation(self.world, random_moves, validator).run_many(seeds)]
+        second = [result.path for result in Simulation(self.world, random_moves, validator).run_many(seeds)]
+        self.assertListEqual(first, second)
+        self.assertListEqual([result.seed for result in Simulation(self.world, "explore").run_many(seeds)],
+                             list(seeds))
+
+    def test_quiet_player(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            player = Player(self.world.starting_room, verbose=False)
+            self.assertFalse(player.travel('n'))
+            self.assertIs(player.current_room, self.world.starting_room)
+            self.assertTrue(player.travel('e'))
+            self.assertEqual(player.current_room.id, 1)
+        self.assertEqual(output.getvalue(), "")
+
+        with contextlib.redirect_stdout(output):
+            self.assertFalse(Player(self.world.starting_room).travel('n'))
+        self.assertEqual(output.getvalue(), "You cannot move in that direction.\n")
+
+if __name__ == '__main__':
+    unittest.main()
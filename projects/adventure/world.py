@@ -1,4 +1,6 @@
-from room import Room
+from .room import Room, DIRECTION_INDEX, NEIGHBOR_ATTRIBUTES
+from .mapfile import read_map
+from array import array
 import random
 import math
 
@@ -6,84 +8,91 @@ class World:
     def __init__(self):
         self.starting_room = None
         self.rooms = {}
-        self.room_grid = []
+        # Sparse grid: (x, y) -> room, only for squares holding a room
+        self.room_grid = {}
         self.grid_size = 0
+        # int32 [rooms x 4] matrix flattened row by row: the room ID through
+        # each exit of room i, in room.DIRECTIONS order, or -1
+        self.neighbors = array('i')
     def load_graph(self, room_graph):
-        num_rooms = len(room_graph)
-        rooms = [None] * num_rooms
+        self.rooms = {}
+        self.room_grid = {}
         grid_size = 1
-        for i in range(0, num_rooms):
-            x = room_graph[i][0][0]
-            grid_size = max(grid_size, room_graph[i][0][0], room_graph[i][0][1])
-            self.rooms[i] = Room(f"Room {i}", f"({room_graph[i][0][0]},{room_graph[i][0][1]})",i, room_graph[i][0][0], room_graph[i][0][1])
-        self.room_grid = []
-        grid_size += 1
-        self.grid_size = grid_size
-        for i in range(0, grid_size):
-            self.room_grid.append([None] * grid_size)
-        for room_id in room_graph:
-            room = self.rooms[room_id]
-            self.room_grid[room.x][room.y] = room
-            if 'n' in room_graph[room_id][1]:
-                self.rooms[room_id].connect_rooms('n', self.rooms[room_graph[room_id][1]['n']])
-            if 's' in room_graph[room_id][1]:
-                self.rooms[room_id].connect_rooms('s', self.rooms[room_graph[room_id][1]['s']])
-            if 'e' in room_graph[room_id][1]:
-                self.rooms[room_id].connect_rooms('e', self.rooms[room_graph[room_id][1]['e']])
-            if 'w' in room_graph[room_id][1]:
-                self.rooms[room_id].connect_rooms('w', self.rooms[room_graph[room_id][1]['w']])
+        for room_id, ((x, y), _) in room_graph.items():
+            grid_size = max(grid_size, x, y)
+            room = Room(f"Room {room_id}", f"({x},{y})", room_id, x, y)
+            self.rooms[room_id] = room
+            self.room_grid[(x, y)] = room
+        self.grid_size = grid_size + 1
+        rooms = self.rooms
+        table = array('i', [-1]) * (4 * (max(rooms, default=-1) + 1))
+        for room_id, (_, exits) in room_graph.items():
+            room = rooms[room_id]
+            for direction, neighbor_id in exits.items():
+                # Same as connect_rooms, also filling in the neighbor table
+                i = DIRECTION_INDEX[direction]
+                neighbor = rooms[neighbor_id]
+                setattr(room, NEIGHBOR_ATTRIBUTES[i], neighbor)
+                setattr(neighbor, NEIGHBOR_ATTRIBUTES[i ^ 1], room)
+                table[4 * room_id + i] = neighbor_id
+                table[4 * neighbor_id + (i ^ 1)] = room_id
+        self.neighbors = table
         self.starting_room = self.rooms[0]
+    def load_file(self, map_file, cache=True):
+        """
+        Load a map file in the text or binary format (see mapfile.py),
+        caching parsed text maps next to the source by default.
+        """
+        self.load_graph(read_map(map_file, cache))
+    def get_room_at(self, x, y):
+        return self.room_grid.get((x, y))
 
     def print_rooms(self):
-        rotated_room_grid = []
-        for i in range(0, len(self.room_grid)):
-            rotated_room_grid.append([None] * len(self.room_grid))
-        for i in range(len(self.room_grid)):
-            for j in range(len(self.room_grid[0])):
-                rotated_room_grid[len(self.room_grid[0]) - j - 1][i] = self.room_grid[i][j]
+        grid_size = self.grid_size
+        room_grid = self.room_grid
+        columns = range(grid_size)
         print("#####")
-        str = ""
-        for row in rotated_room_grid:
-            all_null = True
-            for room in row:
-                if room is not None:
-                    all_null = False
-                    break
-            if all_null:
+        lines = []
+        # Top row first, i.e. the grid rotated so north is up
+        for y in range(grid_size - 1, -1, -1):
+            row = [room_grid.get((x, y)) for x in columns]
+            if all(room is None for room in row):
                 continue
             # PRINT NORTH CONNECTION ROW
-            str += "#"
+            line = ["#"]
             for room in row:
                 if room is not None and room.n_to is not None:
-                    str += "  |  "
+                    line.append("  |  ")
                 else:
-                    str += "     "
-            str += "#\n"
+                    line.append("     ")
+            line.append("#")
+            lines.append("".join(line))
             # PRINT ROOM ROW
-            str += "#"
+            line = ["#"]
             for room in row:
                 if room is not None and room.w_to is not None:
-                    str += "-"
+                    line.append("-")
                 else:
-                    str += " "
+                    line.append(" ")
                 if room is not None:
-                    str += f"{room.id}".zfill(3)
+                    line.append(f"{room.id}".zfill(3))
                 else:
-                    str += "   "
+                    line.append("   ")
                 if room is not None and room.e_to is not None:
-                    str += "-"
+                    line.append("-")
                 else:
-                    str += " "
-            str += "#\n"
+                    line.append(" ")
+            line.append("#")
+            lines.append("".join(line))
             # PRINT SOUTH CONNECTION ROW
-            str += "#"
+            line = ["#"]
             for room in row:
                 if room is not None and room.s_to is not None:
-                    str += "  |  "
+                    line.append("  |  ")
                 else:
-                    str += "     "
-            str += "#\n"
-        print(str)
+                    line.append("     ")
+            line.append("#")
+            lines.append("".join(line))
+        lines.append("")
+        print("\n".join(lines))
         print("#####")
-
-
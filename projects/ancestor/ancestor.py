@@ -1,63 +1,72 @@
-class Queue():
-    def __init__(self):
-        self.queue = []
-    def enqueue(self, value):
-        self.queue.append(value)
-    def dequeue(self):
-        if self.size() > 0:
-            return self.queue.pop(0)
-        else: 
-            return None
-    def size(self):
-        return len(self.queue)
-
-class Graph:
-    def __init__(self):
-        self.vertices = {}
-    def add_vertex(self, vertex_id):
-        if vertex_id not in self.vertices:
-            self.vertices[vertex_id] = set()
-    def add_edge(self, v1, v2):
-        if v1 in self.vertices and v2 in self.vertices:
-            self.vertices[v1].add(v2)
+from ..util import Queue
 
 test_ancestors = [(1, 3), (2, 3), (3, 6), (5, 6), (5, 7), (4, 5), (4, 8), (8, 9), (11, 8), (10, 1)]
 
-def earliest_ancestor(ancestors, starting_node):
-    graph = Graph()
+class AncestorIndex:
+    """
+    Precomputed earliest ancestor of every individual in a list of
+    (parent, child) pairs.
+
+    Built once in O(V + E): individuals are visited in topological order
+    (parents before children) and each one takes the farthest, then
+    lowest-ID, ancestor found through any of its parents. Lookups are then
+    a single dictionary access.
+    """
+    def __init__(self, ancestors):
+        children = {}
+        num_parents = {}
 
-    queue = Queue()
-    queue.enqueue([starting_node])
-   
-    for pair in ancestors:
-        parent = pair[0]
-        child = pair[1]
+        for parent, child in ancestors:
+            children.setdefault(parent, []).append(child)
+            children.setdefault(child, [])
+            num_parents.setdefault(parent, 0)
+            num_parents[child] = num_parents.get(child, 0) + 1
 
-        graph.add_vertex(parent)
-        graph.add_vertex(child)
-        graph.add_edge(child, parent)
+        # Each individual maps to (depth, ancestor) for its farthest ancestor,
+        # starting with (0, itself) for individuals without parents
+        farthest = {}
+        queue = Queue()
 
-    longest_path = 1
-    earliest_ancestor = -1
+        for node, count in num_parents.items():
+            if count == 0:
+                farthest[node] = (0, node)
+                queue.enqueue(node)
 
-    while queue.size() > 0:
-        path = queue.dequeue()
-        curr_node = path[-1]
-        
-        if (len(path) >= longest_path and curr_node < earliest_ancestor) or len(path) > longest_path:
-            longest_path = len(path)
-            earliest_ancestor = curr_node
-        
+        while queue.size() > 0:
+            node = queue.dequeue()
+            depth, ancestor = farthest[node]
 
-        neighbors = graph.vertices[curr_node]
+            for child in children[node]:
+                best_depth, best_ancestor = farthest.get(child, (-1, -1))
+                if depth + 1 > best_depth or (depth + 1 == best_depth and ancestor < best_ancestor):
+                    farthest[child] = (depth + 1, ancestor)
 
-        for ancestor in neighbors:
-            path_copy = list(path)
-            path_copy.append(ancestor)
-            queue.enqueue(path_copy)
-            
-    return earliest_ancestor
+                num_parents[child] -= 1
+                if num_parents[child] == 0:
+                    queue.enqueue(child)
 
+        if len(farthest) < len(num_parents):
+            raise ValueError("Ancestor pairs contain a cycle")
 
+        self.earliest = {node: ancestor if depth > 0 else -1
+                         for node, (depth, ancestor) in farthest.items()}
 
+    def earliest_ancestor(self, node):
+        """
+        Return node's earliest known ancestor, or -1 if it has no parents.
+        """
+        return self.earliest.get(node, -1)
 
+    def earliest_ancestors(self, nodes):
+        """
+        Return the earliest ancestor of each of nodes, in order.
+        """
+        earliest = self.earliest
+        return [earliest.get(node, -1) for node in nodes]
+
+def earliest_ancestor(ancestors, starting_node):
+    """
+    Return the earliest ancestor of starting_node. Build an AncestorIndex
+    directly to answer many queries against the same ancestors.
+    """
+    return AncestorIndex(ancestors).earliest_ancestor(starting_node)
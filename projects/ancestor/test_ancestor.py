@@ -1,5 +1,5 @@
 import unittest
-from ancestor import earliest_ancestor
+from .ancestor import AncestorIndex, earliest_ancestor
 
 class Test(unittest.TestCase):
 
@@ -26,5 +26,25 @@ class Test(unittest.TestCase):
         self.assertEqual(earliest_ancestor(test_ancestors, 10), -1)
         self.assertEqual(earliest_ancestor(test_ancestors, 11), -1)
 
+    def test_ancestor_index(self):
+        test_ancestors = [(1, 3), (2, 3), (3, 6), (5, 6), (5, 7), (4, 5), (4, 8), (8, 9), (11, 8), (10, 1)]
+        index = AncestorIndex(test_ancestors)
+        self.assertListEqual(index.earliest_ancestors(range(1, 12)),
+                             [10, -1, 10, -1, 4, 10, 4, 4, 4, -1, -1])
+        self.assertEqual(index.earliest_ancestor(12), -1)
+
+    def test_ancestor_index_diamonds(self):
+        # 1 -> 2 -> 4 and 1 -> 3 -> 4 repeated: every path is counted once
+        pairs = []
+        for i in range(0, 300, 3):
+            pairs += [(i + 1, i + 2), (i + 1, i + 3), (i + 2, i + 4), (i + 3, i + 4)]
+        index = AncestorIndex(pairs)
+        self.assertEqual(index.earliest_ancestor(301), 1)
+        self.assertEqual(index.earliest_ancestor(3), 1)
+
+    def test_ancestor_index_cycle(self):
+        with self.assertRaises(ValueError):
+            AncestorIndex([(1, 2), (2, 1)])
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,44 @@
+"""
+Time the adventure pipeline on generated mazes of growing size: writing
+the map, loading it into a World, exploring it and replaying the path.
+
+Run from the repository root with:
+    python3 -m projects.benchmarks.bench_adventure [largest_num_rooms]
+"""
+import os
+import sys
+import tempfile
+import time
+from ..adventure.generate import write_maze
+from ..adventure.replay import PathValidator
+from ..adventure.simulation import Simulation
+from ..adventure.world import World
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def run(largest):
+    num_rooms = 1000
+    with tempfile.TemporaryDirectory() as directory:
+        while num_rooms <= largest:
+            path = os.path.join(directory, f"maze_{num_rooms}.map")
+            _, generate_time = timed(write_maze, path, num_rooms, 0, 0.05)
+
+            world = World()
+            _, load_time = timed(world.load_file, path)
+            validator = PathValidator(world)
+            result, explore_time = timed(Simulation(world, "explore", validator).run, 0)
+            replay, replay_time = timed(validator.validate, result.path)
+
+            print(f"{num_rooms:>9} rooms  generate {generate_time:7.3f}s  load {load_time:7.3f}s  "
+                  f"explore {explore_time:7.3f}s  replay {replay_time:7.3f}s  "
+                  f"{result.moves} moves, complete {replay.complete}")
+            num_rooms *= 10
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,73 @@
+"""
+Compare the original recursive dft_recursive/dfs_recursive with the
+explicit-stack versions in Graph.
+
+Run from the repository root with:
+    python3 -m projects.benchmarks.bench_dfs [num_vertices] [avg_degree]
+"""
+import random
+import sys
+import time
+from ..graph.graph import Graph
+
+
+def recursive_dft(graph, vertex, visited):
+    visited.add(vertex)
+    for edge in graph.get_neighbors(vertex):
+        if edge not in visited:
+            recursive_dft(graph, edge, visited)
+    return visited
+
+
+def recursive_dfs(graph, vertex, destination_vertex, visited, path):
+    visited.add(vertex)
+    curr_path = list(path)
+    curr_path.append(vertex)
+    if vertex == destination_vertex:
+        return curr_path
+    for neighbor in graph.get_neighbors(vertex):
+        if neighbor not in visited:
+            new_path = recursive_dfs(graph, neighbor, destination_vertex, visited, curr_path)
+            if new_path is not None:
+                return new_path
+
+
+def random_graph(num_vertices, avg_degree, seed=0):
+    rng = random.Random(seed)
+    graph = Graph()
+    for v in range(num_vertices):
+        graph.add_vertex(v)
+    for v in range(num_vertices):
+        for _ in range(avg_degree):
+            graph.add_edge(v, rng.randrange(num_vertices))
+    return graph
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    try:
+        result = func()
+        print(f"  {label:22} {time.perf_counter() - start:8.3f}s")
+        return result
+    except RecursionError:
+        print(f"  {label:22} RecursionError")
+
+
+def run(num_vertices, avg_degree):
+    # Deep random graphs need a high limit for the recursive versions
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), num_vertices * 2))
+    graph = random_graph(num_vertices, avg_degree)
+    target = num_vertices - 1
+    print(f"{num_vertices} vertices, avg degree {avg_degree}")
+    timed("recursive dft", lambda: recursive_dft(graph, 0, set()))
+    timed("explicit stack dft", lambda: graph.dft_recursive(0))
+    found = timed("recursive dfs", lambda: recursive_dfs(graph, 0, target, set(), []))
+    timed("explicit stack dfs", lambda: graph.dfs_recursive(0, target))
+    if found is not None:
+        print(f"  path length {len(found)}")
+
+
+if __name__ == '__main__':
+    num_vertices = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    avg_degree = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    run(num_vertices, avg_degree)
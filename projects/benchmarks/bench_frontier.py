@@ -0,0 +1,64 @@
+"""
+Compare the one-vertex-at-a-time CSRGraph.bft loop with the NumPy
+frontier-at-a-time CSRGraph.bfs_levels on a large random graph, and the
+same two through Graph.bft, whose vectorized form searches the cached
+freeze() snapshot.
+
+Run from the repository root with:
+    python3 -m projects.benchmarks.bench_frontier [num_vertices] [avg_degree]
+"""
+import random
+import sys
+import time
+from ..graph.csr import CSRGraph
+from ..graph.graph import Graph
+
+
+def random_graph(num_vertices, avg_degree, seed=0):
+    rng = random.Random(seed)
+    return {v: {rng.randrange(num_vertices) for _ in range(avg_degree)}
+            for v in range(num_vertices)}
+
+
+def timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def run(num_vertices, avg_degree):
+    adjacency = random_graph(num_vertices, avg_degree)
+    frozen = CSRGraph.from_adjacency(adjacency)
+    print(f"{len(frozen)} vertices, {frozen.num_edges()} edges")
+
+    start = time.perf_counter()
+    visited = frozen.bft(0)
+    loop_time = time.perf_counter() - start
+    print(f"  python loop  {loop_time:8.3f}s  ({len(visited)} visited)")
+
+    start = time.perf_counter()
+    distances, _ = frozen.bfs_levels(0)
+    frontier_time = time.perf_counter() - start
+    print(f"  numpy levels {frontier_time:8.3f}s  ({int((distances >= 0).sum())} visited)")
+    print(f"  speedup      {loop_time / frontier_time:8.1f}x")
+
+    graph = Graph()
+    for vertex in adjacency:
+        graph.add_vertex(vertex)
+    for vertex, edges in adjacency.items():
+        for edge in edges:
+            graph.add_edge(vertex, edge)
+
+    visited, loop_time = timed(graph.bft, 0)
+    print(f"  Graph.bft                    {loop_time:8.3f}s  ({len(visited)} visited)")
+    _, first_time = timed(graph.bft, 0, vectorized=True)
+    print(f"  Graph.bft vectorized, first  {first_time:8.3f}s  (includes freeze)")
+    visited, cached_time = timed(graph.bft, 0, vectorized=True)
+    print(f"  Graph.bft vectorized, cached {cached_time:8.3f}s  ({len(visited)} visited)")
+    print(f"  speedup                      {loop_time / cached_time:8.1f}x")
+
+
+if __name__ == '__main__':
+    num_vertices = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    avg_degree = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    run(num_vertices, avg_degree)
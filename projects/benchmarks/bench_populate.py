@@ -0,0 +1,31 @@
+"""
+Compare SocialGraph.populate_graph with the exhaustive pair list against
+direct sampling of distinct pairs.
+
+Run from the repository root with:
+    python3 -m projects.benchmarks.bench_populate [avg_friendships] [num_users ...]
+"""
+import sys
+import time
+from ..social.social import SocialGraph
+
+
+def run(avg_friendships, user_counts):
+    sg = SocialGraph()
+    for num_users in user_counts:
+        timings = []
+        for method in ("exhaustive", "sample"):
+            # The pair list needs num_users**2 / 2 tuples, skip it when huge
+            if method == "exhaustive" and num_users > 5000:
+                timings.append("skipped")
+                continue
+            start = time.perf_counter()
+            sg.populate_graph(num_users, avg_friendships, method=method)
+            timings.append(f"{time.perf_counter() - start:.3f}s")
+        print(f"{num_users:>8} users  exhaustive {timings[0]:>9}  sample {timings[1]:>9}")
+
+
+if __name__ == '__main__':
+    avg_friendships = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    user_counts = [int(n) for n in sys.argv[2:]] or [1000, 2000, 5000, 100000]
+    run(avg_friendships, user_counts)
@@ -0,0 +1,65 @@
+"""
+Compare BFS throughput using the old list-backed queue against the shared
+deque-backed util.Queue.
+
+Run from the repository root with:
+    python3 -m projects.benchmarks.bench_queue [num_vertices] [avg_degree]
+"""
+import random
+import sys
+import time
+from ..util import Queue
+
+
+class ListQueue():
+    """The original queue, which pops from the front of a list."""
+    def __init__(self):
+        self.queue = []
+    def enqueue(self, value):
+        self.queue.append(value)
+    def dequeue(self):
+        if self.size() > 0:
+            return self.queue.pop(0)
+        else:
+            return None
+    def size(self):
+        return len(self.queue)
+
+
+def random_graph(num_vertices, avg_degree, seed=0):
+    rng = random.Random(seed)
+    vertices = {v: set() for v in range(num_vertices)}
+    for v in range(num_vertices):
+        for _ in range(avg_degree):
+            vertices[v].add(rng.randrange(num_vertices))
+    return vertices
+
+
+def bft(vertices, start, queue_class):
+    q = queue_class()
+    q.enqueue(start)
+    visited = set()
+    while q.size() > 0:
+        curr_node = q.dequeue()
+        if curr_node not in visited:
+            visited.add(curr_node)
+            for neighbor in vertices[curr_node]:
+                q.enqueue(neighbor)
+    return visited
+
+
+def run(num_vertices, avg_degree):
+    vertices = random_graph(num_vertices, avg_degree)
+    num_edges = sum(len(edges) for edges in vertices.values())
+    print(f"{num_vertices} vertices, {num_edges} edges")
+    for name, queue_class in (("list queue", ListQueue), ("deque queue", Queue)):
+        start = time.perf_counter()
+        visited = bft(vertices, 0, queue_class)
+        elapsed = time.perf_counter() - start
+        print(f"  {name:12} {elapsed:8.3f}s  {num_edges / elapsed:12,.0f} edges/s  ({len(visited)} visited)")
+
+
+if __name__ == '__main__':
+    num_vertices = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    avg_degree = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    run(num_vertices, avg_degree)
@@ -0,0 +1,62 @@
+"""
+Compare Graph.bfs, Graph.dijkstra and Graph.a_star (with a Manhattan
+distance heuristic over Room coordinates) on the adventure maze maps.
+
+Run from the repository root with:
+    python3 -m projects.benchmarks.bench_weighted [num_queries]
+"""
+import os
+import random
+import sys
+import time
+from ..graph.graph import Graph
+from ..adventure.world import World
+
+
+def load_world(map_file):
+    world = World()
+    world.load_file(map_file)
+    return world
+
+
+def world_graph(world):
+    graph = Graph()
+    for room_id in world.rooms:
+        graph.add_vertex(room_id)
+    for room_id, room in world.rooms.items():
+        for direction in room.get_exits():
+            graph.add_edge(room_id, room.get_room_in_direction(direction).id)
+    return graph
+
+
+def run(num_queries):
+    maps = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'adventure', 'maps')
+    for name in sorted(name for name in os.listdir(maps) if name.endswith('.txt')):
+        world = load_world(os.path.join(maps, name))
+        graph = world_graph(world)
+        rng = random.Random(0)
+        queries = [(rng.choice(list(world.rooms)), rng.choice(list(world.rooms)))
+                   for _ in range(num_queries)]
+        print(f"{name}: {len(world.rooms)} rooms, {num_queries} queries")
+
+        def manhattan_to(target):
+            tx, ty = world.rooms[target].get_coords()
+            def heuristic(room_id):
+                x, y = world.rooms[room_id].get_coords()
+                return abs(x - tx) + abs(y - ty)
+            return heuristic
+
+        searches = (
+            ("bfs", lambda a, b: graph.bfs(a, b)),
+            ("dijkstra", lambda a, b: graph.dijkstra(a, b)),
+            ("a_star", lambda a, b: graph.a_star(a, b, manhattan_to(b))),
+        )
+        for label, search in searches:
+            start = time.perf_counter()
+            total = sum(len(search(a, b)) for a, b in queries)
+            elapsed = time.perf_counter() - start
+            print(f"  {label:9} {elapsed:8.3f}s  total path length {total}")
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
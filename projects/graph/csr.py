@@ -0,0 +1,359 @@
+"""
+Compact, read-only graph stored in compressed sparse row (CSR) form.
+"""
+import mmap
+import struct
+import sys
+from array import array
+from ..util import Stack, Queue, ParentArray
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for bfs_levels
+    np = None
+
+
+# Binary CSR file: magic, flags, vertex count, edge count, then int64
+# labels (unless they are 0..n-1), offsets and neighbors arrays
+CSR_MAGIC = b'GRPHCSR1'
+CSR_HEADER = struct.Struct('<8sqqq')
+IDENTITY_LABELS = 1
+
+
+class RangeIndex:
+
+    """Label-to-ID lookup for graphs whose labels are already 0..n-1."""
+    def __init__(self, size):
+        self.size = size
+    def __getitem__(self, vertex_id):
+        if vertex_id not in self:
+            raise KeyError(vertex_id)
+        return vertex_id
+    def get(self, vertex_id, default=None):
+        return vertex_id if vertex_id in self else default
+    def __contains__(self, vertex_id):
+        return isinstance(vertex_id, int) and 0 <= vertex_id < self.size
+    def __len__(self):
+        return self.size
+
+
+class CSRGraph:
+
+    """
+    Represent a frozen graph as two flat integer arrays.
+
+    Vertex labels are packed into contiguous IDs 0..n-1. The neighbors of
+    vertex i are neighbors[offsets[i]:offsets[i + 1]], so an edge costs one
+    machine integer instead of a set entry. The traversal API matches Graph
+    and takes and returns the original labels.
+    """
+    def __init__(self, labels, offsets, neighbors):
+        self.labels = labels
+        if isinstance(labels, range):
+            self.index = RangeIndex(len(labels))
+        else:
+            self.index = {label: i for i, label in enumerate(labels)}
+        self.offsets = offsets
+        self.neighbors = neighbors
+        self._mapped = None
+
+    def save(self, path):
+        """
+        Write the graph in the binary CSR format that open() maps back in.
+        Labels must be integers.
+        """
+        labels = self.labels
+        identity = all(label == i and type(label) is int for i, label in enumerate(labels))
+
+        with open(path, 'wb') as f:
+            f.write(CSR_HEADER.pack(CSR_MAGIC, IDENTITY_LABELS if identity else 0,
+                                    len(labels), len(self.neighbors)))
+            if not identity:
+                _write_int64(f, array('q', labels))
+            _write_int64(f, array('q', self.offsets))
+            _write_int64(f, array('q', self.neighbors))
+
+    @classmethod
+    def open(cls, path):
+        """
+        Memory-map a graph written by save() and traverse it in place.
+
+        The offsets and neighbors arrays are views straight onto the file,
+        so opening costs no parsing and processes opening the same file
+        share its pages through the OS cache. Only a file with non 0..n-1
+        labels needs a label index built on open. Call close() when done.
+        """
+        if sys.byteorder != 'little':
+            raise ValueError("Mapped CSR graphs are little-endian only")
+
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(mapped) < CSR_HEADER.size:
+            mapped.close()
+            raise ValueError(f"{path} is truncated")
+        magic, flags, num_vertices, num_edges = CSR_HEADER.unpack_from(mapped)
+        if magic != CSR_MAGIC:
+            mapped.close()
+            raise ValueError(f"{path} is not a CSR graph file")
+        # Labels (unless implied), n + 1 offsets and m neighbors, exactly
+        num_values = (0 if flags & IDENTITY_LABELS else num_vertices) + num_vertices + 1 + num_edges
+        if num_vertices < 0 or num_edges < 0 or len(mapped) != CSR_HEADER.size + 8 * num_values:
+            mapped.close()
+            raise ValueError(f"{path} is truncated")
+
+        values = memoryview(mapped)[CSR_HEADER.size:].cast('q')
+        if flags & IDENTITY_LABELS:
+            labels = range(num_vertices)
+        else:
+            labels = values[:num_vertices].tolist()
+            values = values[num_vertices:]
+
+        graph = cls(labels, values[:num_vertices + 1], values[num_vertices + 1:num_vertices + 1 + num_edges])
+        graph._mapped = (mapped, values)
+        return graph
+
+    def close(self):
+        """
+        Unmap a graph returned by open(). Arrays taken from it must not be
+        used afterwards.
+        """
+        if self._mapped is not None:
+            mapped, values = self._mapped
+            self.offsets.release()
+            self.neighbors.release()
+            values.release()
+            mapped.close()
+            self._mapped = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @classmethod
+    def from_adjacency(cls, vertices):
+        """
+        Build a CSRGraph from a dictionary mapping labels to edge sets,
+        such as Graph.vertices.
+        """
+        labels = list(vertices)
+        index = {label: i for i, label in enumerate(labels)}
+        offsets = array('q', [0])
+        neighbors = array('q')
+
+        for label in labels:
+            for edge in vertices[label]:
+                if edge not in index:
+                    # Edge into a vertex that was never added
+                    index[edge] = len(labels)
+                    labels.append(edge)
+                neighbors.append(index[edge])
+            offsets.append(len(neighbors))
+
+        # Vertices only seen as edge targets have no outgoing edges
+        offsets.extend([len(neighbors)] * (len(labels) + 1 - len(offsets)))
+
+        return cls(labels, offsets, neighbors)
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __contains__(self, vertex_id):
+        return vertex_id in self.index
+
+    def num_edges(self):
+        return len(self.neighbors)
+
+    def neighbor_ids(self, i):
+        """
+        Get the packed IDs of the neighbors of packed vertex i.
+        """
+        return self.neighbors[self.offsets[i]:self.offsets[i + 1]]
+
+    def get_neighbors(self, vertex_id):
+        """
+        Get all neighbors (edges) of a vertex.
+        """
+        labels = self.labels
+        return {labels[j] for j in self.neighbor_ids(self.index[vertex_id])}
+
+    def bft(self, starting_vertex):
+        """
+        Return the set of vertices reachable from starting_vertex,
+        visited in breadth-first order.
+        """
+        offsets, neighbors = self.offsets, self.neighbors
+        start = self.index[starting_vertex]
+        visited = bytearray(len(self.labels))
+        visited[start] = 1
+        order = [start]
+
+        q = Queue()
+        q.enqueue(start)
+
+        while q.size() > 0:
+            i = q.dequeue()
+            for j in neighbors[offsets[i]:offsets[i + 1]]:
+                if not visited[j]:
+                    visited[j] = 1
+                    order.append(j)
+                    q.enqueue(j)
+
+        labels = self.labels
+        return {labels[i] for i in order}
+
+    def dft(self, starting_vertex):
+        """
+        Return the set of vertices reachable from starting_vertex,
+        visited in depth-first order.
+        """
+        offsets, neighbors = self.offsets, self.neighbors
+        visited = bytearray(len(self.labels))
+        order = []
+
+        stack = Stack()
+        stack.push(self.index[starting_vertex])
+
+        while stack.size() > 0:
+            i = stack.pop()
+            if not visited[i]:
+                visited[i] = 1
+                order.append(i)
+                stack.push_many(neighbors[offsets[i]:offsets[i + 1]])
+
+        labels = self.labels
+        return {labels[i] for i in order}
+
+    def bfs(self, starting_vertex, destination_vertex):
+        """
+        Return a list containing the shortest path from
+        starting_vertex to destination_vertex in
+        breath-first order.
+        """
+        if destination_vertex not in self.index:
+            return None
+
+        offsets, neighbors = self.offsets, self.neighbors
+        start = self.index[starting_vertex]
+        target = self.index[destination_vertex]
+
+        # -1 marks an undiscovered vertex, the start points at itself
+        parents = array('q', [-1]) * len(self.labels)
+        parents[start] = start
+
+        q = Queue()
+        q.enqueue(start)
+
+        while q.size() > 0:
+            i = q.dequeue()
+            if i == target:
+                return self._path(parents, start, target)
+            for j in neighbors[offsets[i]:offsets[i + 1]]:
+                if parents[j] == -1:
+                    parents[j] = i
+                    q.enqueue(j)
+
+    def dfs(self, starting_vertex, destination_vertex):
+        """
+        Return a list containing a path from
+        starting_vertex to destination_vertex in
+        depth-first order.
+        """
+        if destination_vertex not in self.index:
+            return None
+
+        offsets, neighbors = self.offsets, self.neighbors
+        start = self.index[starting_vertex]
+        target = self.index[destination_vertex]
+        parents = array('q', [-1]) * len(self.labels)
+
+        stack = Stack()
+        stack.push((start, start))
+
+        while stack.size() > 0:
+            i, parent = stack.pop()
+            if parents[i] == -1:
+                parents[i] = parent
+                if i == target:
+                    return self._path(parents, start, target)
+                for j in neighbors[offsets[i]:offsets[i + 1]]:
+                    if parents[j] == -1:
+                        stack.push((j, i))
+
+    def bfs_levels(self, starting_vertex):
+        """
+        Run a level-synchronous breadth-first search from starting_vertex,
+        expanding the whole frontier at each step with NumPy.
+
+        Returns (distances, parents) as int64 arrays indexed by packed
+        vertex ID. Unreached vertices have distance and parent -1 and the
+        start is its own parent. Use self.labels to map IDs back to labels.
+        """
+        if np is None:
+            raise ImportError("CSRGraph.bfs_levels requires NumPy")
+
+        offsets = np.frombuffer(self.offsets, dtype=np.int64)
+        neighbors = np.frombuffer(self.neighbors, dtype=np.int64)
+        start = self.index[starting_vertex]
+
+        distances = np.full(len(self.labels), -1, dtype=np.int64)
+        parents = np.full(len(self.labels), -1, dtype=np.int64)
+        distances[start] = 0
+        parents[start] = start
+        owner = np.empty(len(self.labels), dtype=np.int64)
+
+        frontier = np.array([start], dtype=np.int64)
+        level = 0
+
+        while frontier.size > 0:
+            level += 1
+            starts = offsets[frontier]
+            counts = offsets[frontier + 1] - starts
+            total = int(counts.sum())
+            if total == 0:
+                break
+
+            # Gather every neighbor slice of the frontier into one array,
+            # remembering which frontier vertex each edge came from
+            sources = np.repeat(frontier, counts)
+            shift = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+            targets = neighbors[np.arange(total, dtype=np.int64) + shift]
+
+            unseen = distances[targets] < 0
+            targets, sources = targets[unseen], sources[unseen]
+
+            # A vertex reached from several frontier vertices keeps one of
+            # them as its parent; scattering each edge's position and reading
+            # it back picks a single winner per vertex without sorting
+            positions = np.arange(targets.size, dtype=np.int64)
+            owner[targets] = positions
+            winners = owner[targets] == positions
+            frontier = targets[winners]
+            distances[frontier] = level
+            parents[frontier] = sources[winners]
+
+        return distances, parents
+
+    def parent_map(self, parents):
+        """
+        Wrap a parents array indexed by packed ID, such as the one returned
+        by bfs_levels, as a label-keyed util.ParentArray for PathView.
+        """
+        return ParentArray(self.labels, self.index, parents)
+
+    def _path(self, parents, start, target):
+        labels = self.labels
+        path = [labels[target]]
+        while target != start:
+            target = parents[target]
+            path.append(labels[target])
+        path.reverse()
+        return path
+
+
+def _write_int64(f, values):
+    if sys.byteorder != 'little':
+        values.byteswap()
+    f.write(values.tobytes())
@@ -0,0 +1,190 @@
+"""
+Streaming edge-list reader and writer for Graph and SocialGraph.
+
+Three formats are supported, picked from the file extension unless given:
+
+* "text" (any other extension): one "v1 v2" pair per whitespace-separated
+  line. A line with a single label is a vertex without edges; blank lines
+  and lines starting with "#" are skipped.
+* "csv" (.csv): the same, comma-separated.
+* "binary" (.bin): a header of an 8 byte magic and the pair and lone
+  vertex counts, then that many little-endian int64 (v1, v2) pairs and
+  int64 lone vertices. Only integer labels fit.
+
+Files are read line by line or chunk by chunk so they are never held in
+memory whole.
+"""
+import csv
+import os
+import struct
+import sys
+from array import array
+from .graph import Graph
+
+BINARY_MAGIC = b'GRPHEDG2'
+# Magic, pair count, lone vertex count
+BINARY_HEADER = struct.Struct('<8sqq')
+# Pairs per read/write chunk in the binary format
+CHUNK_PAIRS = 65536
+
+
+def guess_format(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        return 'csv'
+    elif extension == '.bin':
+        return 'binary'
+    else:
+        return 'text'
+
+
+def _parse_label(token):
+    try:
+        return int(token)
+    except ValueError:
+        return token
+
+
+def read_edges(path, format=None):
+    """
+    Generate (v1, v2) edges from path, and (v, None) for each lone
+    vertex. Labels that look like integers are returned as ints.
+    """
+    format = format or guess_format(path)
+
+    if format == 'binary':
+        yield from _read_binary(path)
+        return
+    elif format not in ('text', 'csv'):
+        raise ValueError(f"Unknown edge list format: {format}")
+
+    with open(path, newline='') as f:
+        if format == 'csv':
+            rows = csv.reader(f)
+        else:
+            rows = (line.split() for line in f)
+        for row in rows:
+            if not row or row[0].startswith('#'):
+                continue
+            if len(row) == 1:
+                yield _parse_label(row[0].strip()), None
+            elif len(row) == 2:
+                yield _parse_label(row[0].strip()), _parse_label(row[1].strip())
+            else:
+                raise ValueError(f"Expected one or two labels per line in {path}, got {row}")
+
+
+def _read_binary(path):
+    with open(path, 'rb') as f:
+        header = f.read(BINARY_HEADER.size)
+        if header[:len(BINARY_MAGIC)] != BINARY_MAGIC:
+            raise ValueError(f"{path} is not a binary edge list")
+        if len(header) < BINARY_HEADER.size:
+            raise ValueError(f"{path} is truncated")
+        _, num_pairs, num_lone = BINARY_HEADER.unpack(header)
+
+        for first in range(0, num_pairs, CHUNK_PAIRS):
+            values = _read_chunk(f, path, 2 * min(CHUNK_PAIRS, num_pairs - first))
+            yield from zip(values[::2], values[1::2])
+        for first in range(0, num_lone, CHUNK_PAIRS):
+            for vertex in _read_chunk(f, path, min(CHUNK_PAIRS, num_lone - first)):
+                yield vertex, None
+        if f.read(1):
+            raise ValueError(f"{path} has data past its last vertex")
+
+
+def _read_chunk(f, path, count):
+    data = f.read(count * 8)
+    if len(data) != count * 8:
+        raise ValueError(f"{path} is truncated")
+    values = array('q')
+    values.frombytes(data)
+    if sys.byteorder != 'little':
+        values.byteswap()
+    return values
+
+
+def write_edges(path, edges, format=None):
+    """
+    Write (v1, v2) edges to path, streaming them from any iterable. An
+    edge of (v, None) writes a lone vertex. Returns the number of lines,
+    or of pairs and lone vertices, written.
+    """
+    format = format or guess_format(path)
+    count = 0
+
+    if format == 'binary':
+        # Lone vertices go after the pairs, so they are held until the end
+        lone = array('q')
+        with open(path, 'wb') as f:
+            # The counts are filled in once known
+            f.write(BINARY_HEADER.pack(BINARY_MAGIC, 0, 0))
+            values = array('q')
+            for v1, v2 in edges:
+                if v2 is None:
+                    lone.append(v1)
+                    continue
+                values.append(v1)
+                values.append(v2)
+                count += 1
+                if len(values) >= CHUNK_PAIRS * 2:
+                    _write_chunk(f, values)
+                    values = array('q')
+            _write_chunk(f, values)
+            _write_chunk(f, lone)
+            f.seek(0)
+            f.write(BINARY_HEADER.pack(BINARY_MAGIC, count, len(lone)))
+        return count + len(lone)
+    elif format not in ('text', 'csv'):
+        raise ValueError(f"Unknown edge list format: {format}")
+
+    separator = ',' if format == 'csv' else ' '
+    with open(path, 'w', newline='') as f:
+        for v1, v2 in edges:
+            if v2 is None:
+                f.write(f"{v1}\n")
+            else:
+                f.write(f"{v1}{separator}{v2}\n")
+            count += 1
+    return count
+
+
+def _write_chunk(f, values):
+    if sys.byteorder != 'little':
+        values.byteswap()
+    f.write(values.tobytes())
+
+
+def load_graph(path, graph=None, format=None):
+    """
+    Stream the edges in path into graph (a new Graph by default), adding
+    vertices as they are first seen. Returns the graph.
+    """
+    if graph is None:
+        graph = Graph()
+
+    vertices = graph.vertices
+    for v1, v2 in read_edges(path, format):
+        if v1 not in vertices:
+            graph.add_vertex(v1)
+        if v2 is not None:
+            if v2 not in vertices:
+                graph.add_vertex(v2)
+            graph.add_edge(v1, v2)
+    return graph
+
+
+def save_graph(graph, path, format=None):
+    """
+    Write every edge of graph to path, plus a lone vertex for each vertex
+    without edges.
+    """
+    return write_edges(path, _graph_edges(graph), format)
+
+
+def _graph_edges(graph):
+    for vertex, edges in graph.vertices.items():
+        if not edges:
+            yield vertex, None
+        for edge in edges:
+            yield vertex, edge
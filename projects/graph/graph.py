@@ -1,25 +1,104 @@
 """
 Simple graph implementation
 """
-from util import Stack, Queue  # These may come in handy
+import functools
+from ..util import (Stack, Queue, PriorityQueue, DisjointSet, LRUCache, ShortestPathTree,
+                    instrumented, reconstruct_path, bidirectional_search)
+from .csr import CSRGraph
+
+# Marks a missing entry, since None is a valid cached search result
+_MISSING = object()
+
+
+def cached_search(search):
+    """
+    Serve a point-to-point search from the graph's result cache when one
+    is enabled. The cache is emptied whenever the graph's version moves.
+    """
+    @functools.wraps(search)
+    def wrapper(self, starting_vertex, destination_vertex, stats=None):
+        if self.cache is None:
+            return search(self, starting_vertex, destination_vertex, stats=stats)
+
+        if self.cache_version != self.version:
+            self.cache.clear()
+            self.cache_version = self.version
+
+        key = (search.__name__, starting_vertex, destination_vertex)
+        path = self.cache.get(key, _MISSING)
+        if path is _MISSING:
+            path = search(self, starting_vertex, destination_vertex, stats=stats)
+            self.cache.put(key, path)
+        elif stats is not None:
+            stats.reset(search.__name__)
+            stats.cache_hit = True
+            stats.finish(path)
+        # Callers may modify the list they get back
+        return list(path) if path is not None else None
+
+    return wrapper
+
 
 class Graph:
 
-    """Represent a graph as a dictionary of vertices mapping labels to edges."""
+    """
+    Represent a graph as a dictionary of vertices mapping labels to edges.
+
+    The point-to-point searches and shortest_path_tree take an optional
+    stats=util.SearchStats() that records what the call did.
+    """
     def __init__(self):
         self.vertices = {}
+        # Mirror of vertices mapping each vertex to the vertices with an
+        # edge into it, used to search backwards from a target
+        self.reverse = {}
+        # Weight of each (v1, v2) edge not weighing the default 1
+        self.weights = {}
+        # Bumped by every change so cached search results can be dropped
+        self.version = 0
+        self.cache = None
+        self.cache_version = 0
+        # CSR snapshot from freeze() and the version it was built at
+        self._frozen = None
+        self._frozen_version = -1
+
+    def enable_cache(self, maxsize=1024):
+        """
+        Cache the results of bfs, dfs and shortest_path, keeping the
+        maxsize most recently used (search, start, destination) entries.
+        Hit and miss counts are on self.cache.
+        """
+        self.cache = LRUCache(maxsize)
+        self.cache_version = self.version
+
+    def disable_cache(self):
+        self.cache = None
 
     def add_vertex(self, vertex_id):
         """
         Add a vertex to the graph.
         """
+        for edge in self.vertices.get(vertex_id, ()):
+            self.reverse[edge].discard(vertex_id)
+            self.weights.pop((vertex_id, edge), None)
         self.vertices[vertex_id] = set()
+        self.reverse.setdefault(vertex_id, set())
+        self.version += 1
 
-    def add_edge(self, v1, v2):
+    def add_edge(self, v1, v2, weight=1):
         """
-        Add a directed edge to the graph.
+        Add a directed edge to the graph. weight is only used by dijkstra
+        and a_star and must not be negative.
         """
+        if weight < 0:
+            raise ValueError("Edge weights cannot be negative")
         self.vertices[v1].add(v2)
+        if weight != 1:
+            self.weights[(v1, v2)] = weight
+        else:
+            self.weights.pop((v1, v2), None)
+        self.reverse.setdefault(v2, set()).add(v1)
+        self.version += 1
 
     def get_neighbors(self, vertex_id):
         """
@@ -27,11 +106,192 @@ class Graph:
         """
         return self.vertices[vertex_id]
 
-    def bft(self, starting_vertex):
+    def get_weight(self, v1, v2):
+        """
+        Get the weight of the edge from v1 to v2.
+        """
+        return self.weights.get((v1, v2), 1)
+
+    def path_weight(self, path):
+        """
+        Return the total weight of the edges along path.
+        """
+        return sum(self.get_weight(v1, v2) for v1, v2 in zip(path, path[1:]))
+
+    def freeze(self):
+        """
+        Return a read-only CSRGraph snapshot of this graph with the same
+        traversal API, packed into flat integer arrays. The snapshot is
+        cached until the next vertex or edge is added.
+        """
+        if self._frozen is None or self._frozen_version != self.version:
+            self._frozen = CSRGraph.from_adjacency(self.vertices)
+            self._frozen_version = self.version
+        return self._frozen
+
+    @staticmethod
+    def open_frozen(path):
+        """
+        Memory-map a graph saved with freeze().save(path). See CSRGraph.open.
+        """
+        return CSRGraph.open(path)
+
+    def connected_components(self):
+        """
+        Find the connected components of the graph, ignoring edge
+        direction, with a union-find pass over every edge.
+
+        Returns (components, sizes): a dictionary mapping each vertex to
+        its component number, numbered from 0 in vertex order, and a list
+        of component sizes indexed by that number.
+        """
+        index = {vertex: i for i, vertex in enumerate(self.vertices)}
+        for edges in self.vertices.values():
+            for edge in edges:
+                index.setdefault(edge, len(index))
+
+        components = DisjointSet(len(index))
+        for vertex, edges in self.vertices.items():
+            i = index[vertex]
+            for edge in edges:
+                components.union(i, index[edge])
+
+        labels, sizes = components.components()
+        return dict(zip(index, labels)), sizes
+
+    def strongly_connected_components(self):
+        """
+        Find the strongly connected components with Tarjan's algorithm,
+        run on an explicit stack so it works at any depth.
+
+        Returns a dictionary mapping each vertex to its component number.
+        Components are numbered in topological order: every edge between
+        two components goes from a lower number to a higher one.
+        """
+        index = {}
+        low = {}
+        on_stack = set()
+        stack = []
+        found = []
+
+        for root in self.vertices:
+            if root in index:
+                continue
+
+            index[root] = low[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self.vertices[root]))]
+
+            while work:
+                vertex, edges = work[-1]
+                for edge in edges:
+                    if edge not in index:
+                        index[edge] = low[edge] = len(index)
+                        stack.append(edge)
+                        on_stack.add(edge)
+                        work.append((edge, iter(self.vertices.get(edge, ()))))
+                        break
+                    elif edge in on_stack:
+                        low[vertex] = min(low[vertex], index[edge])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[vertex])
+                    if low[vertex] == index[vertex]:
+                        # vertex is the root of a component, pop all of it
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == vertex:
+                                break
+                        found.append(component)
+
+        # Tarjan finds components in reverse topological order
+        components = {}
+        for number, component in enumerate(reversed(found)):
+            for vertex in component:
+                components[vertex] = number
+        return components
+
+    def condensation(self):
+        """
+        Collapse each strongly connected component into one vertex.
+
+        Returns (components, dag): the vertex-to-component mapping from
+        strongly_connected_components and a Graph over the component
+        numbers with an edge wherever the original graph has one between
+        two different components. The result never has cycles.
+        """
+        components = self.strongly_connected_components()
+        dag = Graph()
+        for number in range(max(components.values(), default=-1) + 1):
+            dag.add_vertex(number)
+        for vertex, edges in self.vertices.items():
+            for edge in edges:
+                if components[vertex] != components[edge]:
+                    dag.add_edge(components[vertex], components[edge])
+        return components, dag
+
+    def topological_sort(self):
+        """
+        Return a list of every vertex where each vertex comes before all
+        of the vertices its edges point to. Raises ValueError if the graph
+        has a cycle.
+        """
+        order = self._kahn_order()
+        if order is None:
+            raise ValueError("Graph has a cycle")
+        return order
+
+    def has_cycle(self):
+        """
+        Return True if any directed cycle (including a self loop) exists.
+        """
+        return self._kahn_order() is None
+
+    def _kahn_order(self):
+        # Repeatedly remove vertices with no remaining incoming edges; any
+        # vertex never freed lies on or behind a cycle
+        in_degree = {vertex: 0 for vertex in self.vertices}
+        for edges in self.vertices.values():
+            for edge in edges:
+                in_degree[edge] = in_degree.get(edge, 0) + 1
+
+        q = Queue()
+        q.enqueue_many(vertex for vertex, degree in in_degree.items() if degree == 0)
+        order = []
+
+        while q.size() > 0:
+            vertex = q.dequeue()
+            order.append(vertex)
+            for edge in self.vertices.get(vertex, ()):
+                in_degree[edge] -= 1
+                if in_degree[edge] == 0:
+                    q.enqueue(edge)
+
+        if len(order) < len(in_degree):
+            return None
+        return order
+
+    def bft(self, starting_vertex, vectorized=False):
         """
         Print each vertex in breadth-first order
         beginning from starting_vertex.
+
+        With vectorized=True the search runs level by level over the cached
+        freeze() snapshot using NumPy, which pays off on graphs with
+        millions of edges once the snapshot is built.
         """
+        if vectorized:
+            frozen = self.freeze()
+            distances, _ = frozen.bfs_levels(starting_vertex)
+            reached = (distances >= 0).nonzero()[0]
+            return {frozen.labels[i] for i in reached.tolist()}
+
         q = Queue()
 
         q.enqueue(starting_vertex)
@@ -44,10 +304,7 @@ class Graph:
             if curr_node not in visited:
                 visited.add(curr_node)
 
-                neighbors = self.get_neighbors(curr_node)
-
-                for neighbor in neighbors:
-                    q.enqueue(neighbor)
+                q.enqueue_many(self.get_neighbors(curr_node))
 
         return visited
 
@@ -68,34 +325,43 @@ class Graph:
             if curr_node not in visited:
                 visited.add(curr_node)
 
-                neighbors = self.get_neighbors(curr_node)
-
-                for neighbor in neighbors:
-                    stack.push(neighbor)
+                stack.push_many(self.get_neighbors(curr_node))
 
         return visited
 
-    def dft_recursive(self, vertex, visited=set()):
+    def dft_recursive(self, vertex, visited=None):
         """
         Print each vertex in depth-first order
         beginning from starting_vertex.
 
-        This should be done using recursion.
+        Visits vertices in the same order as the recursive version, but
+        keeps an explicit stack of neighbor iterators instead of Python
+        frames, so deep graphs do not hit the recursion limit. visited
+        defaults to a fresh set on every call.
         """
+        if visited is None:
+            visited = set()
+
         visited.add(vertex)
-        
-        edges = self.get_neighbors(vertex)
 
-        if len(edges) == 0:
-            return
-        else: 
-            for edge in edges:
+        # A plain list keeps the per-step cost close to a recursive call
+        stack = [iter(self.get_neighbors(vertex))]
+
+        while stack:
+            for edge in stack[-1]:
                 if edge not in visited:
-                    self.dft_recursive(edge, visited)
-                else:
-                    return visited
+                    visited.add(edge)
+                    # Descend, resuming the parent's iterator on return
+                    stack.append(iter(self.get_neighbors(edge)))
+                    break
+            else:
+                stack.pop()
+
+        return visited
 
-    def bfs(self, starting_vertex, destination_vertex):
+    @cached_search
+    @instrumented
+    def bfs(self, starting_vertex, destination_vertex, stats=None):
         """
         Return a list containing the shortest path from
         starting_vertex to destination_vertex in
@@ -103,29 +369,95 @@ class Graph:
         """
         q = Queue()
 
-        visited = set()
+        # Each discovered vertex maps to the vertex it was reached from
+        parents = {starting_vertex: None}
 
-        q.enqueue([starting_vertex])
+        q.enqueue(starting_vertex)
 
         while q.size() > 0:
-            curr_path = q.dequeue()
-            curr_node = curr_path[-1]
+            curr_node = q.dequeue()
+
+            if curr_node == destination_vertex:
+                return reconstruct_path(parents, curr_node)
+
+            edges = self.get_neighbors(curr_node)
+            if stats is not None:
+                stats.expand(len(edges), q.size())
+
+            for edge in edges:
+                if edge not in parents:
+                    parents[edge] = curr_node
+                    q.enqueue(edge)
+
+    @cached_search
+    def dijkstra(self, starting_vertex, destination_vertex, stats=None):
+        """
+        Return a list containing the lowest-weight path from
+        starting_vertex to destination_vertex, or None.
+        """
+        return self.a_star(starting_vertex, destination_vertex, lambda vertex: 0, stats=stats)
+
+    @instrumented
+    def a_star(self, starting_vertex, destination_vertex, heuristic, stats=None):
+        """
+        Return a list containing the lowest-weight path from
+        starting_vertex to destination_vertex, or None.
+
+        heuristic(vertex) estimates the remaining weight to the destination
+        and steers the search towards it. It must never overestimate, e.g.
+        Manhattan distance between grid coordinates with unit-weight moves.
+        """
+        pq = PriorityQueue()
+        # Lowest known weight to reach each vertex, and where it came from
+        best = {starting_vertex: 0}
+        parents = {starting_vertex: None}
+
+        pq.push(heuristic(starting_vertex), (0, starting_vertex))
+
+        while pq.size() > 0:
+            _, (cost, curr_node) = pq.pop()
+
+            # Entries are never updated in place, a cheaper route to the
+            # same vertex is pushed again and the old entry skipped here
+            if cost > best[curr_node]:
+                continue
 
             if curr_node == destination_vertex:
-                return curr_path
-            else: 
-                if curr_node not in visited:
-                    visited.add(curr_node)
-                    edges = self.get_neighbors(curr_node)
+                return reconstruct_path(parents, curr_node)
+
+            edges = self.get_neighbors(curr_node)
+            if stats is not None:
+                stats.expand(len(edges), pq.size())
 
-                    for edge in edges:
-                        path_copy = list(curr_path)
-                        path_copy.append(edge)
-                        q.enqueue(path_copy)
+            for edge in edges:
+                new_cost = cost + self.weights.get((curr_node, edge), 1)
+                if edge not in best or new_cost < best[edge]:
+                    best[edge] = new_cost
+                    parents[edge] = curr_node
+                    pq.push(new_cost + heuristic(edge), (new_cost, edge))
+
+    @instrumented
+    def shortest_path_tree(self, starting_vertex, stats=None):
+        """
+        Run one breadth-first search from starting_vertex and return a
+        ShortestPathTree answering path_to(destination) and
+        distance_to(destination) for any number of destinations.
+        """
+        return ShortestPathTree(self.vertices, starting_vertex, stats)
 
-            
+    @cached_search
+    def shortest_path(self, starting_vertex, destination_vertex, stats=None):
+        """
+        Return a list containing the shortest path from
+        starting_vertex to destination_vertex, searching forwards from
+        the start and backwards from the destination at the same time.
+        """
+        return bidirectional_search(self.vertices, self.reverse,
+                                    starting_vertex, destination_vertex, stats=stats)
 
-    def dfs(self, starting_vertex, destination_vertex):
+    @cached_search
+    @instrumented
+    def dfs(self, starting_vertex, destination_vertex, stats=None):
         """
         Return a list containing a path from
         starting_vertex to destination_vertex in
@@ -133,65 +465,69 @@ class Graph:
         """
         stack = Stack()
 
-        visited = set()
+        # A vertex's parent is whichever vertex pushed the entry that was
+        # popped first, so the stack holds (vertex, parent) pairs
+        parents = {}
 
-        stack.push([starting_vertex])
+        stack.push((starting_vertex, None))
 
         while stack.size() > 0:
-            curr_path = stack.pop()
-            curr_node = curr_path[-1]
-            
-            if curr_node == destination_vertex:
-                return curr_path
-            else: 
-                if curr_node not in visited:
-                    visited.add(curr_node)
-                    edges = self.get_neighbors(curr_node)
+            curr_node, parent = stack.pop()
+
+            if curr_node not in parents:
+                parents[curr_node] = parent
+
+                if curr_node == destination_vertex:
+                    return reconstruct_path(parents, curr_node)
 
-                    for edge in edges:
-                        path_copy = list(curr_path)
-                        path_copy.append(edge)
-                        stack.push(path_copy)
+                edges = self.get_neighbors(curr_node)
+                if stats is not None:
+                    stats.expand(len(edges), stack.size())
 
-    def dfs_recursive(self, vertex, destination_vertex, visited=set(), path=[]):
+                for edge in edges:
+                    if edge not in parents:
+                        stack.push((edge, curr_node))
+
+    def dfs_recursive(self, vertex, destination_vertex, visited=None, path=None):
         """
         Return a list containing a path from
         starting_vertex to destination_vertex in
         depth-first order.
 
-        This should be done using recursion.
+        Explores in the same order as the recursive version using an
+        explicit stack, extending and trimming one shared path list rather
+        than copying it per frame. visited and path default to fresh
+        containers on every call; path is an optional prefix.
         """
-     
+        if visited is None:
+            visited = set()
+
+        curr_path = list(path) if path is not None else []
+
         visited.add(vertex)
-        curr_path = list(path)
         curr_path.append(vertex)
 
-        neighbors = self.get_neighbors(vertex)
-
         if vertex == destination_vertex:
             return curr_path
 
-        for neighbor in neighbors:
-            if neighbor not in visited:
-                new_path = self.dfs_recursive(neighbor, destination_vertex, visited, curr_path)
-               
-                if new_path is not None:
-                    return new_path
-           
-                   
-                       
-            
-        
-    
-                
-            
-            
-        
-
-                
-                    
-                    
-                
+        stack = [iter(self.get_neighbors(vertex))]
+
+        while stack:
+            for neighbor in stack[-1]:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    curr_path.append(neighbor)
+
+                    if neighbor == destination_vertex:
+                        return curr_path
+
+                    stack.append(iter(self.get_neighbors(neighbor)))
+                    break
+            else:
+                # Dead end, backtrack out of the vertex on top of the path
+                stack.pop()
+                curr_path.pop()
+
 
 if __name__ == '__main__':
     graph = Graph()  # Instantiate your graph
@@ -1,7 +1,11 @@
 import unittest
 import sys
 import io
-from graph import Graph
+import os
+import tempfile
+from . import csr, edgelist
+from .graph import Graph
+from ..util import SearchStats
 
 class Test(unittest.TestCase):
     def setUp(self):
@@ -115,5 +119,288 @@ class Test(unittest.TestCase):
         ]
         self.assertIn(self.graph.dfs_recursive(1,6), dfs)
 
+    def test_freeze(self):
+        frozen = self.graph.freeze()
+        self.assertEqual(len(frozen), 7)
+        self.assertEqual(frozen.num_edges(), 10)
+        for vertex, edges in self.graph.vertices.items():
+            self.assertSetEqual(frozen.get_neighbors(vertex), edges)
+        self.assertSetEqual(frozen.bft(1), self.graph.bft(1))
+        self.assertSetEqual(frozen.dft(5), {3, 5})
+        self.assertListEqual(frozen.bfs(1, 6), [1, 2, 4, 6])
+        self.assertIn(frozen.dfs(1, 6), [[1, 2, 4, 6], [1, 2, 4, 7, 6]])
+        self.assertIsNone(frozen.bfs(3, 1))
+        self.assertIsNone(frozen.dfs(3, 1))
+
+    def test_freeze_is_cached_until_changed(self):
+        frozen = self.graph.freeze()
+        self.assertIs(self.graph.freeze(), frozen)
+        self.graph.add_edge(3, 1)
+        refrozen = self.graph.freeze()
+        self.assertIsNot(refrozen, frozen)
+        self.assertSetEqual(refrozen.get_neighbors(3), {1, 5})
+        self.graph.add_vertex(8)
+        self.assertIn(8, self.graph.freeze())
+
+    @unittest.skipUnless(csr.np is not None, "requires NumPy")
+    def test_bfs_levels(self):
+        frozen = self.graph.freeze()
+        distances, parents = frozen.bfs_levels(1)
+        by_label = {frozen.labels[i]: d for i, d in enumerate(distances.tolist())}
+        self.assertDictEqual(by_label, {1: 0, 2: 1, 3: 2, 4: 2, 5: 3, 6: 3, 7: 3})
+        self.assertEqual(frozen.labels[parents[frozen.index[6]]], 4)
+        self.assertSetEqual(self.graph.bft(1, vectorized=True), self.graph.bft(1))
+        self.assertSetEqual(self.graph.bft(5, vectorized=True), {3, 5})
+
+    def test_edge_list_round_trip(self):
+        self.graph.add_vertex(8)
+        with tempfile.TemporaryDirectory() as tmp:
+            for name in ("graph.txt", "graph.csv", "graph.bin"):
+                path = os.path.join(tmp, name)
+                edgelist.save_graph(self.graph, path)
+                loaded = edgelist.load_graph(path)
+                self.assertDictEqual(loaded.vertices, self.graph.vertices)
+
+    def test_binary_edge_list(self):
+        chunk = edgelist.CHUNK_PAIRS
+        edgelist.CHUNK_PAIRS = 2
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, "graph.bin")
+                edges = [(1, 2), (8, None), (2, 3), (3, 1), (9, None), (10, None), (4, 5), (11, None)]
+                self.assertEqual(edgelist.write_edges(path, edges), len(edges))
+                self.assertListEqual(list(edgelist.read_edges(path)),
+                                     [edge for edge in edges if edge[1] is not None]
+                                     + [edge for edge in edges if edge[1] is None])
+
+                size = os.path.getsize(path)
+                for cut in (4, 8, 40):
+                    with open(path, 'r+b') as f:
+                        f.truncate(size - cut)
+                    with self.assertRaisesRegex(ValueError, "truncated"):
+                        list(edgelist.read_edges(path))
+                with open(path, 'wb') as f:
+                    f.write(b'GRPHEDG1' + bytes(16))
+                with self.assertRaisesRegex(ValueError, "not a binary edge list"):
+                    list(edgelist.read_edges(path))
+        finally:
+            edgelist.CHUNK_PAIRS = chunk
+
+    def test_mapped_csr_file(self):
+        strings = Graph()
+        for vertex in "abc":
+            strings.add_vertex(vertex)
+        strings.add_edge("a", "b")
+        identity = Graph()
+        for vertex in range(3):
+            identity.add_vertex(vertex)
+        identity.add_edge(0, 2)
+        identity.add_edge(2, 1)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "graph.csr")
+            self.graph.freeze().save(path)
+            with Graph.open_frozen(path) as mapped:
+                self.assertEqual(len(mapped), 7)
+                self.assertSetEqual(mapped.bft(1), self.graph.bft(1))
+                self.assertListEqual(mapped.bfs(1, 6), [1, 2, 4, 6])
+                self.assertIn(mapped.dfs(1, 6), [[1, 2, 4, 6], [1, 2, 4, 7, 6]])
+                self.assertSetEqual(mapped.get_neighbors(7), {1, 6})
+
+            identity.freeze().save(path)
+            with Graph.open_frozen(path) as mapped:
+                self.assertIsInstance(mapped.labels, range)
+                self.assertListEqual(mapped.bfs(0, 1), [0, 2, 1])
+                self.assertIsNone(mapped.bfs(1, 0))
+                self.assertNotIn(3, mapped)
+
+            with self.assertRaises(TypeError):
+                strings.freeze().save(path)
+
+    def test_truncated_csr_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "graph.csr")
+            identity = Graph()
+            for vertex in range(3):
+                identity.add_vertex(vertex)
+            for graph in (self.graph, identity):
+                graph.freeze().save(path)
+                size = os.path.getsize(path)
+                with Graph.open_frozen(path):
+                    pass
+                for cut in (3, 16, size - 4):
+                    with open(path, 'r+b') as f:
+                        f.truncate(size - cut)
+                    with self.assertRaisesRegex(ValueError, "truncated"):
+                        Graph.open_frozen(path)
+                    graph.freeze().save(path)
+
+    def test_shortest_path(self):
+        for start in self.graph.vertices:
+            for end in self.graph.vertices:
+                expected = self.graph.bfs(start, end)
+                path = self.graph.shortest_path(start, end)
+                if expected is None:
+                    self.assertIsNone(path)
+                else:
+                    self.assertEqual(len(path), len(expected))
+                    self.assertEqual((path[0], path[-1]), (start, end))
+                    for v1, v2 in zip(path, path[1:]):
+                        self.assertIn(v2, self.graph.vertices[v1])
+        self.assertListEqual(self.graph.shortest_path(1, 6), [1, 2, 4, 6])
+
+    def test_recursive_searches_are_reentrant_and_deep(self):
+        self.assertSetEqual(self.graph.dft_recursive(1), {1, 2, 3, 4, 5, 6, 7})
+        self.assertSetEqual(self.graph.dft_recursive(5), {3, 5})
+        self.assertIn(self.graph.dfs_recursive(1, 6), [[1, 2, 4, 6], [1, 2, 4, 7, 6]])
+        self.assertIn(self.graph.dfs_recursive(1, 6), [[1, 2, 4, 6], [1, 2, 4, 7, 6]])
+        self.assertIsNone(self.graph.dfs_recursive(3, 1))
+
+        chain = Graph()
+        depth = sys.getrecursionlimit() * 5
+        for i in range(depth):
+            chain.add_vertex(i)
+        for i in range(depth - 1):
+            chain.add_edge(i, i + 1)
+        self.assertEqual(len(chain.dft_recursive(0)), depth)
+        self.assertListEqual(chain.dfs_recursive(0, depth - 1), list(range(depth)))
+
+    def test_connected_components(self):
+        components, sizes = self.graph.connected_components()
+        self.assertEqual(set(components.values()), {0})
+        self.assertListEqual(sizes, [7])
+
+        self.graph.add_vertex(8)
+        self.graph.add_vertex(9)
+        self.graph.add_vertex(10)
+        self.graph.add_edge(10, 9)
+        components, sizes = self.graph.connected_components()
+        self.assertEqual((components[8], components[9], components[10]), (1, 2, 2))
+        self.assertListEqual(sizes, [7, 1, 2])
+
+    def test_strongly_connected_components(self):
+        components = self.graph.strongly_connected_components()
+        self.assertEqual(len({components[v] for v in (1, 2, 4, 7)}), 1)
+        self.assertEqual(components[3], components[5])
+        self.assertListEqual([components[1], components[6], components[3]], [0, 1, 2])
+
+        components, dag = self.graph.condensation()
+        self.assertDictEqual(dag.vertices, {0: {1, 2}, 1: {2}, 2: set()})
+        self.assertFalse(dag.has_cycle())
+        self.assertListEqual(dag.topological_sort(), [0, 1, 2])
+
+    def test_cycles_and_topological_sort(self):
+        self.assertTrue(self.graph.has_cycle())
+        with self.assertRaises(ValueError):
+            self.graph.topological_sort()
+
+        chain = Graph()
+        depth = sys.getrecursionlimit() * 5
+        for i in range(depth):
+            chain.add_vertex(i)
+        for i in range(depth - 1):
+            chain.add_edge(i, i + 1)
+        self.assertListEqual(chain.topological_sort(), list(range(depth)))
+        self.assertEqual(len(set(chain.strongly_connected_components().values())), depth)
+        chain.add_edge(depth - 1, 0)
+        self.assertTrue(chain.has_cycle())
+        self.assertEqual(set(chain.strongly_connected_components().values()), {0})
+
+    def test_search_cache(self):
+        self.graph.enable_cache(maxsize=2)
+        self.assertListEqual(self.graph.bfs(1, 6), [1, 2, 4, 6])
+        path = self.graph.bfs(1, 6)
+        self.assertListEqual(path, [1, 2, 4, 6])
+        path.append(99)
+        self.assertListEqual(self.graph.bfs(1, 6), [1, 2, 4, 6])
+        self.assertIsNone(self.graph.dfs(3, 1))
+        self.assertIsNone(self.graph.dfs(3, 1))
+        self.assertEqual((self.graph.cache.hits, self.graph.cache.misses), (3, 2))
+
+        # A third key evicts the least recently used one
+        self.graph.shortest_path(1, 7)
+        self.assertEqual(len(self.graph.cache), 2)
+        self.assertNotIn(("bfs", 1, 6), self.graph.cache)
+
+        self.graph.add_edge(3, 1)
+        self.assertListEqual(self.graph.dfs(3, 1), [3, 1])
+        self.assertEqual(len(self.graph.cache), 1)
+
+        self.graph.disable_cache()
+        self.assertListEqual(self.graph.bfs(1, 6), [1, 2, 4, 6])
+
+    def test_shortest_path_tree(self):
+        tree = self.graph.shortest_path_tree(1)
+        self.assertEqual(tree.source, 1)
+        self.assertEqual(len(tree), 7)
+        for vertex in self.graph.vertices:
+            self.assertListEqual(tree.path_to(vertex), self.graph.bfs(1, vertex))
+            self.assertEqual(tree.distance_to(vertex), len(self.graph.bfs(1, vertex)) - 1)
+        tree = self.graph.shortest_path_tree(3)
+        self.assertIsNone(tree.path_to(1))
+        self.assertIsNone(tree.distance_to(1))
+        self.assertDictEqual(dict(tree.paths()), {3: [3], 5: [3, 5]})
+
+    def test_weighted_searches(self):
+        self.assertListEqual(self.graph.dijkstra(1, 6), [1, 2, 4, 6])
+        self.graph.add_edge(4, 6, 5)
+        self.graph.add_edge(7, 6, 0.5)
+        self.assertEqual(self.graph.get_weight(4, 6), 5)
+        self.assertListEqual(self.graph.dijkstra(1, 6), [1, 2, 4, 7, 6])
+        self.assertEqual(self.graph.path_weight([1, 2, 4, 7, 6]), 3.5)
+        self.assertListEqual(self.graph.bfs(1, 6), [1, 2, 4, 6])
+        self.assertIsNone(self.graph.dijkstra(3, 1))
+        self.assertListEqual(self.graph.a_star(1, 6, lambda vertex: 0), [1, 2, 4, 7, 6])
+        # Re-adding an edge with the default weight resets it
+        self.graph.add_edge(4, 6)
+        self.assertListEqual(self.graph.dijkstra(1, 6), [1, 2, 4, 6])
+        with self.assertRaises(ValueError):
+            self.graph.add_edge(1, 3, -1)
+
+    def test_a_star_grid(self):
+        grid = Graph()
+        size = 30
+        for x in range(size):
+            for y in range(size):
+                grid.add_vertex((x, y))
+        for x in range(size):
+            for y in range(size):
+                for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+                    if 0 <= x + dx < size and 0 <= y + dy < size and not (x + dx == 15 and y + dy < 25):
+                        grid.add_edge((x, y), (x + dx, y + dy))
+        target = (size - 1, 0)
+        manhattan = lambda vertex: abs(vertex[0] - target[0]) + abs(vertex[1] - target[1])
+        path = grid.a_star((0, 0), target, manhattan)
+        self.assertEqual(len(path), len(grid.bfs((0, 0), target)))
+        self.assertEqual(len(path), len(grid.dijkstra((0, 0), target)))
+
+    def test_search_stats(self):
+        exported = []
+        stats = SearchStats(callback=lambda stats: exported.append(stats.as_dict()))
+        self.assertListEqual(self.graph.bfs(1, 6, stats=stats), [1, 2, 4, 6])
+        self.assertEqual(stats.search, "bfs")
+        self.assertEqual(stats.vertices_visited, 5)
+        self.assertEqual(stats.edges_scanned, 1 + 2 + 1 + 2 + 1)
+        self.assertGreater(stats.max_frontier, 0)
+        self.assertGreater(stats.path_bytes, 0)
+        self.assertGreaterEqual(stats.elapsed, 0)
+
+        self.assertIsNone(self.graph.dfs(3, 1, stats=stats))
+        self.assertEqual((stats.search, stats.vertices_visited, stats.path_bytes), ("dfs", 2, 0))
+        self.graph.shortest_path(1, 6, stats=stats)
+        self.assertEqual(stats.search, "bidirectional_search")
+        self.graph.dijkstra(1, 6, stats=stats)
+        self.assertEqual(stats.search, "a_star")
+        self.graph.shortest_path_tree(1, stats=stats)
+        self.assertEqual((stats.vertices_visited, stats.edges_scanned), (7, 10))
+        self.assertEqual(len(exported), 5)
+
+        self.graph.enable_cache()
+        self.graph.bfs(1, 6, stats=stats)
+        self.assertFalse(stats.cache_hit)
+        self.graph.bfs(1, 6, stats=stats)
+        self.assertTrue(stats.cache_hit)
+        self.assertEqual(stats.vertices_visited, 0)
+
 if __name__ == '__main__':
     unittest.main()
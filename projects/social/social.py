@@ -1,15 +1,83 @@
+import multiprocessing
+import os
 import random
-from util import Queue
+from array import array
+from multiprocessing import shared_memory
+from ..util import (Queue, DisjointSet, PathView, ShortestPathTree, instrumented,
+                    bidirectional_search)
+from ..graph.csr import CSRGraph
+from ..graph.edgelist import read_edges, write_edges
+
+# Friendship arrays attached by each all_social_paths worker process
+_shared = {}
+
+
+def _attach_shared(offsets_name, neighbors_name, labels, num_vertices, num_edges):
+    offsets = shared_memory.SharedMemory(name=offsets_name)
+    neighbors = shared_memory.SharedMemory(name=neighbors_name)
+    _shared['blocks'] = (offsets, neighbors)
+    # Blocks may be rounded up to a whole page, so only the sizes passed
+    # in are used
+    _shared['offsets'] = offsets.buf.cast('q')[:num_vertices + 1]
+    _shared['neighbors'] = neighbors.buf.cast('q')[:num_edges]
+    _shared['labels'] = labels
+
+
+def _shared_social_paths(start):
+    """
+    Breadth-first search from packed user ID start over the shared CSR
+    arrays, returning (user_id, parents) where parents is an array of
+    packed IDs as used by CSRGraph.parent_map.
+    """
+    offsets, neighbors = _shared['offsets'], _shared['neighbors']
+    parents = array('q', [-1]) * (len(offsets) - 1)
+    parents[start] = start
+
+    queue = Queue()
+    queue.enqueue(start)
+
+    while queue.size() > 0:
+        i = queue.dequeue()
+        for j in neighbors[offsets[i]:offsets[i + 1]]:
+            if parents[j] == -1:
+                parents[j] = i
+                queue.enqueue(j)
+
+    return _shared['labels'][start], parents
+
 
 class User:
     def __init__(self, name):
         self.name = name
 
+class FriendshipStats:
+    """Counts of what happened to each pair given to add_friendships."""
+    def __init__(self):
+        self.added = 0
+        self.self_friendships = 0
+        self.duplicates = 0
+        self.unknown_users = 0
+    def merge(self, other):
+        self.added += other.added
+        self.self_friendships += other.self_friendships
+        self.duplicates += other.duplicates
+        self.unknown_users += other.unknown_users
+    def rejected(self):
+        return self.self_friendships + self.duplicates + self.unknown_users
+    def __repr__(self):
+        return (f"FriendshipStats(added={self.added}, self_friendships={self.self_friendships}, "
+                f"duplicates={self.duplicates}, unknown_users={self.unknown_users})")
+
 class SocialGraph:
     def __init__(self):
         self.last_id = 0
         self.users = {}
         self.friendships = {}
+        # CSR snapshot of friendships, rebuilt after any change
+        self._frozen = None
+        # Union-find over user IDs kept up to date as friendships are added;
+        # slot 0 is unused since IDs start at 1
+        self._components = DisjointSet(1)
 
     def add_friendship(self, user_id, friend_id):
         """
@@ -22,6 +90,80 @@ class SocialGraph:
         else:
             self.friendships[user_id].add(friend_id)
             self.friendships[friend_id].add(user_id)
+            self._components.union(user_id, friend_id)
+            self._frozen = None
+
+    def add_friendships(self, pairs):
+        """
+        Creates a bi-directional friendship for every (user_id, friend_id)
+        pair in pairs, which may be any iterable of pairs or an N x 2 NumPy
+        array.
+
+        Nothing is printed: self-friendships, pairs that already exist
+        (including repeats within pairs) and pairs naming unknown users are
+        skipped and counted in the returned FriendshipStats.
+        """
+        if hasattr(pairs, 'tolist'):
+            # Unpacking plain ints is much faster than NumPy scalars
+            pairs = pairs.tolist()
+
+        stats = FriendshipStats()
+        friendships = self.friendships
+        union = self._components.union
+
+        for user_id, friend_id in pairs:
+            if user_id == friend_id:
+                stats.self_friendships += 1
+            elif user_id not in friendships or friend_id not in friendships:
+                stats.unknown_users += 1
+            elif friend_id in friendships[user_id]:
+                stats.duplicates += 1
+            else:
+                friendships[user_id].add(friend_id)
+                friendships[friend_id].add(user_id)
+                union(user_id, friend_id)
+                stats.added += 1
+
+        if stats.added:
+            self._frozen = None
+        return stats
+
+    def load_friendships(self, path, format=None, chunk_size=100000):
+        """
+        Stream friendships from an edge list file (see edgelist.py) into
+        the graph, chunk_size pairs at a time. Users are created as needed
+        so every ID up to the largest one seen exists; lone IDs only create
+        users. Returns the combined FriendshipStats.
+        """
+        stats = FriendshipStats()
+        chunk = []
+
+        for user_id, friend_id in read_edges(path, format):
+            while self.last_id < max(user_id, friend_id or 0):
+                self.add_user(f"User {self.last_id + 1}")
+            if friend_id is not None:
+                chunk.append((user_id, friend_id))
+            if len(chunk) >= chunk_size:
+                stats.merge(self.add_friendships(chunk))
+                chunk = []
+
+        stats.merge(self.add_friendships(chunk))
+        return stats
+
+    def save_friendships(self, path, format=None):
+        """
+        Write each friendship once, lower user ID first, to an edge list
+        file. Users without friends are written as lone IDs.
+        """
+        return write_edges(path, self._friendship_pairs(), format)
+
+    def _friendship_pairs(self):
+        for user_id, friends in self.friendships.items():
+            if not friends:
+                yield user_id, None
+            for friend_id in friends:
+                if user_id < friend_id:
+                    yield user_id, friend_id
 
     def add_user(self, name):
         """
@@ -30,8 +172,19 @@ class SocialGraph:
         self.last_id += 1  # automatically increment the ID to assign the new user
         self.users[self.last_id] = User(name)
         self.friendships[self.last_id] = set()
+        self._components.add()
+        self._frozen = None
+
+    def freeze(self):
+        """
+        Return a read-only CSRGraph of the friendships. The snapshot is
+        cached until the next user or friendship is added.
+        """
+        if self._frozen is None:
+            self._frozen = CSRGraph.from_adjacency(self.friendships)
+        return self._frozen
 
-    def populate_graph(self, num_users, avg_friendships):
+    def populate_graph(self, num_users, avg_friendships, method="sample"):
         """
         Takes a number of users and an average number of friendships
         as arguments
@@ -40,35 +193,66 @@ class SocialGraph:
         between those users.
 
         The number of users must be greater than the average number of friendships.
+
+        method="sample" draws random pairs until enough distinct ones are
+        found, which takes time proportional to the friendships created.
+        method="exhaustive" lists and shuffles every possible pair, which is
+        quadratic in num_users. Sampling falls back to the exhaustive method
+        when more than half of all possible pairs are needed.
         """
+        if method not in ("sample", "exhaustive"):
+            raise ValueError(f"Unknown populate method: {method}")
+
         # Reset graph
         self.last_id = 0
         self.users = {}
         self.friendships = {}
-
-        # !!!! IMPLEMENT ME
+        self._frozen = None
+        self._components = DisjointSet(1)
 
         # Add users
         for user in range(num_users):
             self.add_user(user)
-      
+
+        total_friendships = num_users * avg_friendships
+        pairs_needed = total_friendships // 2
+        possible_pairs = num_users * (num_users - 1) // 2
+
+        if method == "exhaustive" or pairs_needed > possible_pairs // 2:
+            random_friendships = self._exhaustive_pairs(pairs_needed)
+        else:
+            random_friendships = self._sampled_pairs(pairs_needed)
+
+        self.add_friendships(random_friendships)
+
+    def _exhaustive_pairs(self, pairs_needed):
         # Create friendships
         friendships = []
-      
+
         for user in range(1, self.last_id):
             for friend in range(user + 1, self.last_id + 1):
                 friendships.append((user, friend))
-        
+
         random.shuffle(friendships)
 
-        total_friendships = num_users * avg_friendships
-        pairs_needed = total_friendships // 2
-        random_friendships = friendships[:pairs_needed]
+        return friendships[:pairs_needed]
 
-        for friendship in random_friendships:
-            self.add_friendship(friendship[0], friendship[1])
+    def _sampled_pairs(self, pairs_needed):
+        friendships = set()
 
-    def get_all_social_paths(self, user_id):
+        while len(friendships) < pairs_needed:
+            user = random.randint(1, self.last_id)
+            friend = random.randint(1, self.last_id)
+            # Store each pair low ID first so (a, b) and (b, a) collide
+            if user < friend:
+                friendships.add((user, friend))
+            elif friend < user:
+                friendships.add((friend, user))
+
+        return friendships
+
+    @instrumented
+    def get_all_social_paths(self, user_id, lazy=False, vectorized=False, stats=None):
         """
         Takes a user's user_id as an argument
 
@@ -76,27 +260,104 @@ class SocialGraph:
         extended network with the shortest friendship path between them.
 
         The key is the friend's ID and the value is the path.
+
+        If lazy is True, returns a read-only PathView instead, which keeps
+        only a parent pointer per user and builds each path on lookup.
+
+        With vectorized=True the search expands a whole frontier at a time
+        with NumPy over the cached CSR snapshot of the friendships.
+
+        stats=util.SearchStats() records counters for the call; vectorized
+        searches only report their time and path bytes.
+        """
+        if vectorized:
+            paths = PathView(self._frontier_parents(user_id))
+        else:
+            paths = ShortestPathTree(self.friendships, user_id, stats).paths()
+
+        if lazy:
+            return paths
+        return dict(paths)
+
+    @instrumented
+    def shortest_path_tree(self, user_id, stats=None):
+        """
+        Return a ShortestPathTree of friendship paths out from user_id, for
+        asking path_to(friend_id) or distance_to(friend_id) repeatedly.
+        """
+        return ShortestPathTree(self.friendships, user_id, stats)
+
+    def connected_components(self):
+        """
+        Return (components, sizes) for the friendship graph: a dictionary
+        mapping each user ID to its component number, numbered from 0 in
+        user ID order, and a list of component sizes indexed by that
+        number. Components are maintained as friendships are added, so
+        this only labels the users.
+        """
+        labels, sizes = self._components.components(range(1, self.last_id + 1))
+        return dict(zip(range(1, self.last_id + 1), labels)), sizes
+
+    def shortest_path(self, user_id, friend_id, stats=None):
+        """
+        Return the shortest friendship path between two users, or None if
+        they are not connected. Searches out from both users at once, so
+        only their neighborhoods are explored.
+        """
+        return bidirectional_search(self.friendships, self.friendships, user_id, friend_id,
+                                    stats=stats)
+
+    def all_social_paths(self, user_ids=None, workers=None):
+        """
+        Generate (user_id, paths) for each of user_ids (every user by
+        default), where paths is a PathView as returned by
+        get_all_social_paths(user_id, lazy=True).
+
+        The searches run in a pool of workers processes (one per CPU by
+        default). The friendship graph is copied once into shared memory
+        that every worker attaches to, so only user IDs and results cross
+        process boundaries. Results are yielded as they finish, not in
+        the order of user_ids.
         """
-        queue = Queue()
+        if user_ids is None:
+            user_ids = list(self.users)
+        if workers is None:
+            workers = os.cpu_count() or 1
 
-        visited = {}  # Note that this is a dictionary, not a set
-        # !!!! IMPLEMENT ME
+        if workers <= 1:
+            for user_id in user_ids:
+                yield user_id, self.get_all_social_paths(user_id, lazy=True)
+            return
 
-        queue.enqueue([user_id])
+        frozen = self.freeze()
+        starts = [frozen.index[user_id] for user_id in user_ids]
+        blocks = []
+        pool = None
+        try:
+            for values in (frozen.offsets, frozen.neighbors):
+                # SharedMemory rejects a size of 0, e.g. for a graph without friendships
+                block = shared_memory.SharedMemory(create=True, size=max(len(values), 1) * values.itemsize)
+                blocks.append(block)
+                block.buf[:len(values) * values.itemsize] = values.tobytes()
 
-        while queue.size() > 0:
-            curr_path = queue.dequeue()
-            curr_node = curr_path[-1]
+            pool = multiprocessing.Pool(workers, initializer=_attach_shared,
+                                        initargs=(blocks[0].name, blocks[1].name, frozen.labels,
+                                                  len(frozen.labels), frozen.num_edges()))
+            chunksize = max(1, len(starts) // (workers * 8))
+            for user_id, parents in pool.imap_unordered(_shared_social_paths, starts, chunksize):
+                yield user_id, PathView(frozen.parent_map(parents))
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+            for block in blocks:
+                block.close()
+                block.unlink()
 
-            if curr_node not in visited.keys(): 
-                visited[curr_node] = curr_path
-                edges = self.friendships[curr_node]
-            
-                for edge in edges:
-                    path_copy = list(curr_path)
-                    path_copy.append(edge)
-                    queue.enqueue(path_copy)
-        return visited
+    def _frontier_parents(self, user_id):
+        frozen = self.freeze()
+        _, parents = frozen.bfs_levels(user_id)
+        return frozen.parent_map(parents)
 
 
 if __name__ == '__main__':
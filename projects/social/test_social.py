@@ -0,0 +1,146 @@
+import os
+import tempfile
+import unittest
+from .social import SocialGraph
+from ..util import SearchStats
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class Test(unittest.TestCase):
+    '''
+    1 - 2 - 3   6
+    |       |
+    4 - 5 --+
+    '''
+    def setUp(self):
+        self.sg = SocialGraph()
+        for i in range(6):
+            self.sg.add_user(f"User {i + 1}")
+        for user_id, friend_id in [(1, 2), (2, 3), (1, 4), (4, 5), (5, 3)]:
+            self.sg.add_friendship(user_id, friend_id)
+
+    def test_get_all_social_paths(self):
+        paths = self.sg.get_all_social_paths(1)
+        self.assertEqual(set(paths), {1, 2, 3, 4, 5})
+        self.assertListEqual(paths[1], [1])
+        self.assertListEqual(paths[4], [1, 4])
+        self.assertListEqual(paths[5], [1, 4, 5])
+        self.assertListEqual(paths[3], [1, 2, 3])
+        self.assertDictEqual(self.sg.get_all_social_paths(6), {6: [6]})
+
+    def test_get_all_social_paths_lazy(self):
+        lazy = self.sg.get_all_social_paths(1, lazy=True)
+        self.assertEqual(len(lazy), 5)
+        self.assertNotIn(6, lazy)
+        self.assertEqual(lazy, self.sg.get_all_social_paths(1))
+
+    @unittest.skipUnless(np is not None, "requires NumPy")
+    def test_get_all_social_paths_vectorized(self):
+        for user_id in range(1, 7):
+            self.assertDictEqual(self.sg.get_all_social_paths(user_id, vectorized=True),
+                                 self.sg.get_all_social_paths(user_id))
+
+    def test_all_social_paths(self):
+        expected = {user_id: self.sg.get_all_social_paths(user_id) for user_id in range(1, 7)}
+        for workers in (1, 2):
+            results = dict(self.sg.all_social_paths(workers=workers))
+            self.assertDictEqual(results, expected)
+        results = dict(self.sg.all_social_paths([2, 6], workers=2))
+        self.assertDictEqual(results, {2: expected[2], 6: expected[6]})
+
+    def test_populate_graph(self):
+        for method in ("sample", "exhaustive"):
+            self.sg.populate_graph(100, 4, method=method)
+            self.assertEqual(len(self.sg.users), 100)
+            degrees = [len(friends) for friends in self.sg.friendships.values()]
+            self.assertEqual(sum(degrees), 400)
+            for user_id, friends in self.sg.friendships.items():
+                self.assertNotIn(user_id, friends)
+                for friend_id in friends:
+                    self.assertIn(user_id, self.sg.friendships[friend_id])
+        # Dense graphs fall back to listing every pair
+        self.sg.populate_graph(5, 4)
+        self.assertEqual(sum(len(friends) for friends in self.sg.friendships.values()), 20)
+        with self.assertRaises(ValueError):
+            self.sg.populate_graph(10, 2, method="bogus")
+        # Rejected before anything changes, even where a dense graph would
+        # otherwise have fallen back to the exhaustive method
+        with self.assertRaises(ValueError):
+            self.sg.populate_graph(4, 3, method="bogus")
+        self.assertEqual(len(self.sg.users), 5)
+
+    def test_add_friendships(self):
+        stats = self.sg.add_friendships([(1, 3), (3, 1), (2, 2), (6, 1), (2, 1), (1, 7)])
+        self.assertEqual(stats.added, 2)
+        self.assertEqual(stats.self_friendships, 1)
+        self.assertEqual(stats.duplicates, 2)
+        self.assertEqual(stats.unknown_users, 1)
+        self.assertEqual(stats.rejected(), 4)
+        self.assertSetEqual(self.sg.friendships[1], {2, 3, 4, 6})
+        self.assertSetEqual(self.sg.friendships[6], {1})
+        self.assertListEqual(self.sg.get_all_social_paths(6)[3], [6, 1, 3])
+
+    def test_friendships_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for name in ("friends.txt", "friends.csv", "friends.bin"):
+                path = os.path.join(tmp, name)
+                self.sg.save_friendships(path)
+                loaded = SocialGraph()
+                stats = loaded.load_friendships(path, chunk_size=2)
+                self.assertEqual(stats.added, 5)
+                self.assertEqual(stats.rejected(), 0)
+                # User 6, who has no friends, is kept too
+                self.assertEqual(loaded.last_id, 6)
+                for user_id in range(1, loaded.last_id + 1):
+                    self.assertSetEqual(loaded.friendships[user_id], self.sg.friendships[user_id])
+
+    def test_shortest_path(self):
+        self.assertListEqual(self.sg.shortest_path(1, 3), [1, 2, 3])
+        self.assertListEqual(self.sg.shortest_path(4, 3), [4, 5, 3])
+        self.assertListEqual(self.sg.shortest_path(2, 2), [2])
+        self.assertIsNone(self.sg.shortest_path(1, 6))
+        self.sg.populate_graph(300, 3)
+        for friend_id in range(2, 300, 7):
+            path = self.sg.shortest_path(1, friend_id)
+            expected = self.sg.get_all_social_paths(1).get(friend_id)
+            self.assertEqual(path is None, expected is None)
+            if path is not None:
+                self.assertEqual(len(path), len(expected))
+
+    def test_connected_components(self):
+        components, sizes = self.sg.connected_components()
+        self.assertDictEqual(components, {1: 0, 2: 0, 3: 0, 4: 0, 5: 0, 6: 1})
+        self.assertListEqual(sizes, [5, 1])
+        self.sg.add_user("User 7")
+        self.sg.add_friendships([(6, 7)])
+        components, sizes = self.sg.connected_components()
+        self.assertEqual(components[7], components[6])
+        self.assertListEqual(sizes, [5, 2])
+        self.sg.add_friendship(7, 1)
+        self.assertListEqual(self.sg.connected_components()[1], [7])
+        self.sg.populate_graph(50, 1)
+        components, sizes = self.sg.connected_components()
+        for user_id in range(1, 51):
+            reach = self.sg.get_all_social_paths(user_id)
+            self.assertEqual(sizes[components[user_id]], len(reach))
+
+    def test_shortest_path_tree(self):
+        tree = self.sg.shortest_path_tree(4)
+        self.assertListEqual(tree.path_to(3), [4, 5, 3])
+        self.assertEqual(tree.distance_to(2), 2)
+        self.assertIsNone(tree.distance_to(6))
+
+    def test_search_stats(self):
+        stats = SearchStats()
+        self.sg.get_all_social_paths(1, stats=stats)
+        self.assertEqual((stats.search, stats.vertices_visited, stats.edges_scanned),
+                         ("get_all_social_paths", 5, 10))
+        self.assertGreater(stats.path_bytes, 0)
+        self.sg.get_all_social_paths(1, lazy=True, stats=stats)
+        self.assertEqual(stats.path_bytes, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,426 @@
+"""
+Shared data structures used by the graph, social, ancestor and adventure
+projects.
+"""
+import functools
+import heapq
+import sys
+import time
+from array import array
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+
+
+class Queue():
+    """FIFO queue backed by a deque, so both ends are O(1)."""
+    def __init__(self, values=None):
+        self.queue = deque()
+        if values is not None:
+            self.queue.extend(values)
+    def enqueue(self, value):
+        self.queue.append(value)
+    def enqueue_many(self, values):
+        self.queue.extend(values)
+    def dequeue(self):
+        if self.queue:
+            return self.queue.popleft()
+        else:
+            return None
+    def size(self):
+        return len(self.queue)
+    def __len__(self):
+        return len(self.queue)
+    def __iter__(self):
+        return iter(self.queue)
+
+
+class Stack():
+    """LIFO stack backed by a list."""
+    def __init__(self, values=None):
+        self.stack = []
+        if values is not None:
+            self.stack.extend(values)
+    def push(self, value):
+        self.stack.append(value)
+    def push_many(self, values):
+        self.stack.extend(values)
+    def pop(self):
+        if self.stack:
+            return self.stack.pop()
+        else:
+            return None
+    def size(self):
+        return len(self.stack)
+    def __len__(self):
+        return len(self.stack)
+    def __iter__(self):
+        # Iterate from the top of the stack down, i.e. in pop order
+        return reversed(self.stack)
+
+
+class SearchStats():
+    """
+    Counters for one search call. Pass stats=SearchStats() to a search to
+    fill it in; searches called without one skip the bookkeeping. Reusing
+    an object overwrites it on every call, and callback(stats), if given,
+    runs as each call finishes so the numbers can be exported.
+    """
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.reset()
+    def reset(self, search=None):
+        self.search = search
+        self.vertices_visited = 0
+        self.edges_scanned = 0
+        self.max_frontier = 0
+        self.path_bytes = 0
+        self.cache_hit = False
+        self.elapsed = 0.0
+        self._started = time.perf_counter()
+    def expand(self, degree, frontier):
+        """Count one vertex whose degree edges were scanned."""
+        self.vertices_visited += 1
+        self.edges_scanned += degree
+        if frontier > self.max_frontier:
+            self.max_frontier = frontier
+    def finish(self, result=None):
+        """Stop the clock and count the bytes of any path lists returned."""
+        self.elapsed = time.perf_counter() - self._started
+        if isinstance(result, list):
+            self.path_bytes += sys.getsizeof(result)
+        elif isinstance(result, dict):
+            self.path_bytes += sum(sys.getsizeof(path) for path in result.values())
+        if self.callback is not None:
+            self.callback(self)
+    def as_dict(self):
+        return {
+            "search": self.search,
+            "vertices_visited": self.vertices_visited,
+            "edges_scanned": self.edges_scanned,
+            "max_frontier": self.max_frontier,
+            "path_bytes": self.path_bytes,
+            "cache_hit": self.cache_hit,
+            "elapsed": self.elapsed,
+        }
+    def __repr__(self):
+        fields = ", ".join(f"{key}={value!r}" for key, value in self.as_dict().items())
+        return f"SearchStats({fields})"
+
+
+def instrumented(search):
+    """
+    Give a search taking a stats keyword its timing: with stats, reset it
+    before the call and finish it with the result afterwards. Without
+    stats the search is called straight through.
+    """
+    @functools.wraps(search)
+    def wrapper(*args, stats=None, **kwargs):
+        if stats is None:
+            return search(*args, **kwargs)
+        stats.reset(search.__name__)
+        result = search(*args, stats=stats, **kwargs)
+        stats.finish(result)
+        return result
+    return wrapper
+
+
+class PriorityQueue():
+    """
+    Binary-heap min-priority queue. Entries with equal priority come out
+    in insertion order, and values themselves are never compared.
+    """
+    def __init__(self):
+        self.heap = []
+        self.counter = 0
+    def push(self, priority, value):
+        heapq.heappush(self.heap, (priority, self.counter, value))
+        self.counter += 1
+    def pop(self):
+        """Remove and return the lowest (priority, value), or None."""
+        if self.heap:
+            priority, _, value = heapq.heappop(self.heap)
+            return priority, value
+        else:
+            return None
+    def size(self):
+        return len(self.heap)
+    def __len__(self):
+        return len(self.heap)
+
+
+class DisjointSet():
+    """
+    Union-find over the integers 0..n-1, stored in flat arrays, with path
+    compression and union by rank.
+    """
+    def __init__(self, size=0):
+        self.parent = array('q', range(size))
+        self.rank = array('B', bytes(size))
+        self.count = size
+    def add(self):
+        """Add a new singleton set and return its element."""
+        element = len(self.parent)
+        self.parent.append(element)
+        self.rank.append(0)
+        self.count += 1
+        return element
+    def find(self, element):
+        parent = self.parent
+        root = element
+        while parent[root] != root:
+            root = parent[root]
+        # Point everything on the walked path straight at the root
+        while parent[element] != root:
+            parent[element], element = root, parent[element]
+        return root
+    def union(self, a, b):
+        """Merge the sets holding a and b. Returns False if already joined."""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return False
+        rank = self.rank
+        if rank[root_a] < rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        if rank[root_a] == rank[root_b]:
+            rank[root_a] += 1
+        self.count -= 1
+        return True
+    def components(self, elements=None):
+        """
+        Number the sets containing elements (all by default) 0, 1, ... in
+        order of first appearance. Returns (labels, sizes): the set number
+        of each element in order, and the size of each numbered set counted
+        over elements.
+        """
+        if elements is None:
+            elements = range(len(self.parent))
+        numbers = {}
+        labels = []
+        sizes = []
+        for element in elements:
+            root = self.find(element)
+            if root not in numbers:
+                numbers[root] = len(sizes)
+                sizes.append(0)
+            labels.append(numbers[root])
+            sizes[numbers[root]] += 1
+        return labels, sizes
+    def __len__(self):
+        return len(self.parent)
+
+
+class LRUCache():
+    """
+    Mapping with at most maxsize entries that evicts the least recently
+    used one, counting lookup hits and misses.
+    """
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    def get(self, key, default=None):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+        self.misses += 1
+        return default
+    def put(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+    def clear(self):
+        self.entries.clear()
+    def __contains__(self, key):
+        return key in self.entries
+    def __len__(self):
+        return len(self.entries)
+
+
+def reconstruct_path(parents, vertex):
+    """
+    Walk a predecessor map back from vertex to the search root and return
+    the path in root-to-vertex order. The root maps to None.
+    """
+    path = []
+    while vertex is not None:
+        path.append(vertex)
+        vertex = parents[vertex]
+    path.reverse()
+    return path
+
+
+class PathView(Mapping):
+    """
+    Read-only mapping of vertex -> path built from a predecessor map.
+
+    Only the parent pointers are stored; a path list is materialized when
+    its key is looked up.
+    """
+    def __init__(self, parents):
+        self.parents = parents
+    def __getitem__(self, vertex):
+        if vertex not in self.parents:
+            raise KeyError(vertex)
+        return reconstruct_path(self.parents, vertex)
+    def __contains__(self, vertex):
+        return vertex in self.parents
+    def __iter__(self):
+        return iter(self.parents)
+    def __len__(self):
+        return len(self.parents)
+    def __repr__(self):
+        return f"PathView({len(self.parents)} paths)"
+
+
+class ParentArray(Mapping):
+    """
+    Adapt a parents array indexed by packed vertex ID, as produced by
+    CSRGraph and ShortestPathTree searches, to the label-keyed predecessor
+    mapping that PathView expects. Unreached vertices hold -1 and are
+    absent; the search root holds itself and maps to None.
+    """
+    def __init__(self, labels, index, parents):
+        self.labels = labels
+        self.index = index
+        self.parents = parents
+        self._reached = None
+    def __getitem__(self, vertex_id):
+        i = self.index.get(vertex_id, -1)
+        if i == -1 or self.parents[i] == -1:
+            raise KeyError(vertex_id)
+        parent = self.parents[i]
+        return None if parent == i else self.labels[parent]
+    def __contains__(self, vertex_id):
+        i = self.index.get(vertex_id, -1)
+        return i != -1 and self.parents[i] != -1
+    def __iter__(self):
+        labels = self.labels
+        return (labels[i] for i, parent in enumerate(self.parents) if parent != -1)
+    def __len__(self):
+        if self._reached is None:
+            self._reached = sum(1 for parent in self.parents if parent != -1)
+        return self._reached
+
+
+class ShortestPathTree():
+    """
+    Breadth-first shortest paths from one source to every reachable vertex.
+
+    The search runs once. Vertices are numbered in the order they are
+    reached, and parent and distance per vertex are stored in flat integer
+    arrays, so any number of path_to/distance_to queries can follow
+    without searching again.
+    """
+    def __init__(self, adjacency, source, stats=None):
+        # labels doubles as the BFS queue: position i is expanded in turn
+        self.labels = [source]
+        self.index = {source: 0}
+        self.parents = array('q', [0])
+        self.distances = array('q', [0])
+
+        labels, index, parents, distances = self.labels, self.index, self.parents, self.distances
+        i = 0
+        while i < len(labels):
+            neighbors = adjacency[labels[i]]
+            if stats is not None:
+                stats.expand(len(neighbors), len(labels) - i)
+            for neighbor in neighbors:
+                if neighbor not in index:
+                    index[neighbor] = len(labels)
+                    labels.append(neighbor)
+                    parents.append(i)
+                    distances.append(distances[i] + 1)
+            i += 1
+
+    @property
+    def source(self):
+        return self.labels[0]
+    def path_to(self, vertex):
+        """Return the shortest path from the source to vertex, or None."""
+        i = self.index.get(vertex)
+        if i is None:
+            return None
+        labels, parents = self.labels, self.parents
+        path = [labels[i]]
+        while i != 0:
+            i = parents[i]
+            path.append(labels[i])
+        path.reverse()
+        return path
+    def distance_to(self, vertex):
+        """Return the number of edges from the source to vertex, or None."""
+        i = self.index.get(vertex)
+        return None if i is None else self.distances[i]
+    def paths(self):
+        """Return a PathView of every reachable vertex's path."""
+        return PathView(ParentArray(self.labels, self.index, self.parents))
+    def __contains__(self, vertex):
+        return vertex in self.index
+    def __iter__(self):
+        return iter(self.labels)
+    def __len__(self):
+        return len(self.labels)
+
+
+@instrumented
+def bidirectional_search(forward, backward, source, target, stats=None):
+    """
+    Return a shortest path from source to target, or None if there is none.
+
+    forward maps each vertex to its out-neighbors and backward to its
+    in-neighbors (the same mapping for undirected graphs). The search grows
+    whichever side has the smaller frontier one full level at a time and
+    stops at the first level where the two sides meet, so it only explores
+    around both ends instead of the whole component.
+    """
+    if source == target:
+        return [source]
+
+    parents_f, parents_b = {source: None}, {target: None}
+    depth_f, depth_b = {source: 0}, {target: 0}
+    frontier_f, frontier_b = [source], [target]
+
+    while frontier_f and frontier_b:
+        if len(frontier_f) <= len(frontier_b):
+            frontier_f, meeting = _expand_level(forward, frontier_f, parents_f, depth_f, depth_b, stats)
+        else:
+            frontier_b, meeting = _expand_level(backward, frontier_b, parents_b, depth_b, depth_f, stats)
+        if meeting is not None:
+            path = reconstruct_path(parents_f, meeting)
+            vertex = parents_b[meeting]
+            while vertex is not None:
+                path.append(vertex)
+                vertex = parents_b[vertex]
+            return path
+
+    return None
+
+
+def _expand_level(adjacency, frontier, parents, depth, other_depth, stats):
+    """
+    Expand every vertex of frontier once. Returns the next frontier and the
+    meeting vertex with the shortest total path, if the sides touched.
+    """
+    next_frontier = []
+    meeting = None
+    best = None
+
+    for vertex in frontier:
+        neighbors = adjacency[vertex]
+        if stats is not None:
+            stats.expand(len(neighbors), len(frontier))
+        for neighbor in neighbors:
+            if neighbor not in parents:
+                parents[neighbor] = vertex
+                depth[neighbor] = depth[vertex] + 1
+                next_frontier.append(neighbor)
+                if neighbor in other_depth:
+                    length = depth[neighbor] + other_depth[neighbor]
+                    if best is None or length < best:
+                        best, meeting = length, neighbor
+
+    return next_frontier, meeting